@@ -42,6 +42,9 @@ def get_vocabs(text: str, stopwords: List) -> Tuple[Tuple[str], Tuple[int]]:
     if not text:
         return ()
 
+    # hash-set of the stopwords -> one lookup per word instead of a scan over the list
+    stopwords = frozenset(stopwords)
+
     # process the text, extract the word list and generate a dictionary containing word count
     words = get_words(text)
     words_dict = {}
@@ -0,0 +1,64 @@
+"""
+Timing helpers shared by the benchmarks of Set 3 (bench_task8.py, bench_task8_users.py, bench_task9.py).
+
+The benchmarks import this module from the parent folder of their task folder.
+"""
+import time
+from typing import Callable, Dict, List
+
+
+# ==================== LATENCIES ====================
+def get_percentile(values: List[float], percentile: float) -> float:
+    """
+    Get the percentile of the values (nearest rank).
+
+    Args:
+        1. values (List[float]): the values.
+        2. percentile (float): the percentile, between 0 and 100.
+
+    Returns:
+        float: the value at the percentile (0.0 without values).
+    """
+    if not values:
+        return 0.0
+
+    values = sorted(values)
+    rank = max(round(percentile / 100 * len(values)) - 1, 0)
+    return values[min(rank, len(values) - 1)]
+
+
+def time_calls(func: Callable, args_list: List[tuple]) -> List[float]:
+    """
+    Call func once per arguments, one call at a time, and measure the latency of each call.
+
+    Args:
+        1. func (Callable): the function to time.
+        2. args_list (List[tuple]): the arguments of each call.
+
+    Returns:
+        List[float]: the latency of each call (seconds).
+    """
+    latencies = []
+    for args in args_list:
+        start = time.perf_counter()
+        func(*args)
+        latencies.append(time.perf_counter() - start)
+
+    return latencies
+
+
+def summarize_latencies(latencies: List[float], prefix: str = "") -> Dict[str, float]:
+    """
+    Get the p50 / p99 of the latencies, in ms.
+
+    Args:
+        1. latencies (List[float]): the latencies (seconds).
+        2. prefix (str): the prefix of the result keys (e.g. "read_" for "read_p50_ms").
+
+    Returns:
+        Dict[str, float]: the p50 / p99 latency (ms).
+    """
+    return {
+        f"{prefix}p50_ms": round(get_percentile(latencies, 50) * 1000, 4),
+        f"{prefix}p99_ms": round(get_percentile(latencies, 99) * 1000, 4)
+    }
@@ -0,0 +1,167 @@
+"""
+Benchmarks for the TextProcessor of Task 7.
+
+Run with:
+    python bench_task7.py
+(the vocabulary files saved by TextProcessor are written to a temporary folder)
+"""
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+
+import pandas as pd
+
+from task7 import StopwordIndex, TextProcessor, get_words
+
+# CONSTANTS - benchmark data
+DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+STOPWORDS_FILEPATH = os.path.join(DATA_PATH, "stop_words_english.txt")
+CORPUS_FILEPATH = os.path.join(DATA_PATH, "ag_news_test.csv")
+IDX2LABEL_FILEPATH = os.path.join(DATA_PATH, "idx2label.json")
+
+
+# ==================== REFERENCE IMPLEMENTATIONS ====================
+def legacy_get_words(text: str) -> List[str]:
+    """
+    The original per-character tokenizer of TextProcessor._get_words,
+    kept as the reference to check the output of the bulk tokenizer (see test_task7.py).
+
+    Args:
+        1. text (str): the input text string
+
+    Returns:
+        words (List[str]): a list of lowercase words
+    """
+    PUNTUATIONS = "!\"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~"
+
+    words = []
+    word_buffer = ""
+    for char in text:
+        if not word_buffer and (char.isspace() or char in PUNTUATIONS):
+            continue
+
+        if char not in PUNTUATIONS and not char.isspace():
+            word_buffer += char
+        else:
+            word = word_buffer.lower()
+            if len(word) >= 2 and not any(c.isdigit() for c in word):
+                words.append(word)
+            word_buffer = ""
+
+    if word_buffer and len(word_buffer) >= 2 and not any(c.isdigit() for c in word_buffer):
+        words.append(word_buffer.lower())
+
+    return words
+
+
+# ==================== BENCHMARKS ====================
+def bench_tokenizer(texts: List[str]) -> None:
+    """
+    Print the tokens/sec of the reference and the bulk tokenizer over the whole corpus.
+
+    Args:
+        1. texts (List[str]): the corpus texts.
+    """
+    text = " ".join(texts)
+
+    for name, tokenizer in (("legacy", legacy_get_words), ("bulk", get_words)):
+        start = time.perf_counter()
+        n_tokens = len(tokenizer(text))
+        elapsed = time.perf_counter() - start
+        print(f"tokenizer[{name}]: {n_tokens} tokens in {elapsed:.3f}s "
+              f"({n_tokens / elapsed:,.0f} tokens/sec)")
+
+
+def bench_stopwords(texts: List[str]) -> None:
+    """
+    Print the tokens/sec of the stopword filtering over the whole corpus,
+    with the stopword list and with the stopword index.
+
+    Args:
+        1. texts (List[str]): the corpus texts.
+    """
+    with open(STOPWORDS_FILEPATH, "r") as f:
+        stopwords = [line.strip().lower() for line in f]
+    words = get_words(" ".join(texts))
+
+    for name, index in (("list", stopwords), ("index", StopwordIndex(stopwords))):
+        start = time.perf_counter()
+        kept = [word for word in words if word not in index]
+        elapsed = time.perf_counter() - start
+        print(f"stopwords[{name}]: {len(kept)}/{len(words)} tokens kept in {elapsed:.3f}s "
+              f"({len(words) / elapsed:,.0f} tokens/sec)")
+
+
+def bench_label_join(tp: TextProcessor, n_repeat: int = 20) -> None:
+    """
+    Print the time to attach the label names to the corpus, with the original pandas merge
+    and with the precomputed label lookup (and check both dataframes are identical).
+
+    Args:
+        1. tp (TextProcessor): the text processor holding the label lookup.
+        2. n_repeat (int): number of repetitions.
+    """
+    corpus_df = pd.read_csv(CORPUS_FILEPATH)
+    label_df = tp.idx2label
+
+    joins = (
+        ("merge", lambda: pd.merge(corpus_df, label_df, on="label", how="inner")),
+        ("lookup", lambda: tp._join_label_names(corpus_df, label_df))
+    )
+    pd.testing.assert_frame_equal(joins[0][1](), joins[1][1]())
+
+    for name, join in joins:
+        start = time.perf_counter()
+        for _ in range(n_repeat):
+            join()
+        elapsed = (time.perf_counter() - start) / n_repeat
+        print(f"label join[{name}]: {elapsed * 1000:.2f}ms per corpus")
+
+
+def bench_workers(tp: TextProcessor, texts: List[str], max_workers: int) -> None:
+    """
+    Print the scaling curve of the corpus word counting from 1 to max_workers processes
+    (the time includes starting the pool, as for a corpus file), and check every curve point
+    gives the same word counts as the in-process counting.
+
+    Args:
+        1. tp (TextProcessor): the text processor counting the words.
+        2. texts (List[str]): the corpus texts.
+        3. max_workers (int): the largest number of worker processes.
+    """
+    workers = tp.workers
+    baseline = None
+    serial_word_freq = None
+
+    for n_workers in range(1, max_workers + 1):
+        tp.workers = n_workers
+        start = time.perf_counter()
+        if n_workers == 1:
+            word_freq = tp._count_corpus_words(texts)
+        else:
+            with ProcessPoolExecutor(max_workers=n_workers) as pool:
+                word_freq = tp._count_corpus_words(texts, pool)
+        elapsed = time.perf_counter() - start
+
+        serial_word_freq = serial_word_freq or word_freq
+        assert word_freq == serial_word_freq, f"workers={n_workers}: word counts differ from the serial counts"
+
+        baseline = baseline or elapsed
+        print(f"workers={n_workers}: {elapsed:.3f}s (speedup x{baseline / elapsed:.2f})")
+
+    tp.workers = workers
+
+
+if __name__ == "__main__":
+    corpus_texts = pd.read_csv(CORPUS_FILEPATH)["text"].tolist()
+
+    bench_tokenizer(corpus_texts)
+    bench_stopwords(corpus_texts)
+
+    with tempfile.TemporaryDirectory() as tmp_path:
+        os.chdir(tmp_path)
+        tp = TextProcessor(STOPWORDS_FILEPATH, CORPUS_FILEPATH, IDX2LABEL_FILEPATH)
+        bench_label_join(tp)
+        bench_workers(tp, corpus_texts, max_workers=max(os.cpu_count() or 1, 4))
@@ -0,0 +1,128 @@
+"""
+Tests for the TextProcessor of Task 7.
+
+Run with:
+    python -m pytest test_task7.py
+"""
+import os
+import random
+import string
+
+import pandas as pd
+import pytest
+
+from bench_task7 import CORPUS_FILEPATH, IDX2LABEL_FILEPATH, STOPWORDS_FILEPATH, legacy_get_words
+from task7 import PERSIST_NEVER, PERSIST_POLICIES, STORAGE_BINARY, STORAGE_TEXT, TextProcessor, get_words
+
+# CONSTANTS - random texts checked against the reference tokenizer
+N_RANDOM_TEXTS = 2000
+RANDOM_ALPHABET = string.ascii_letters + string.digits + string.punctuation + " \t\n\r\x0b\x0céÉ²ß"
+
+
+# ==================== TOKENIZER ====================
+@pytest.mark.parametrize("text", [
+    "",
+    " ",
+    "!?.,;:-",
+    " \t\n\r\x0b\x0c",
+    "... --- !!!",
+    "--Hello, World!--",
+    "  leading and trailing  ",
+    "'quoted'",
+    "the and of a to",
+    "The AND of; a, to!",
+    "a b c I x",
+    "abc123 123 1st 2nd ab1c",
+    "Café naïve résumé ÉCOLE straße",
+    "日本語 テキスト, 中文!",
+    "x² e⁴ ½ ①② ٣٤",
+    "Ünïcödé-words_and.more",
+    "tab\tseparated\nlines\r\nhere"
+])
+def test_get_words_edge_cases(text):
+    """
+    The bulk tokenizer gives the same words as the reference tokenizer on empty texts,
+    delimiter-only texts, leading / trailing delimiters, short words, digits and non-ASCII words.
+    """
+    assert get_words(text) == legacy_get_words(text)
+
+
+def test_get_words_stopwords_only():
+    """
+    A text made only of stopwords gives the same (stopword) words as the reference tokenizer.
+    """
+    text = "The, and OF a to -- in is it! you that he was"
+    assert get_words(text) == legacy_get_words(text)
+    assert get_words(text) == ["the", "and", "of", "to", "in", "is", "it", "you", "that", "he", "was"]
+
+
+def test_get_words_random_texts():
+    """
+    The bulk tokenizer gives the same words as the reference tokenizer on random strings
+    mixing letters, digits, punctuations, whitespaces and non-ASCII characters.
+    """
+    rng = random.Random(9136)
+    for _ in range(N_RANDOM_TEXTS):
+        text = "".join(rng.choice(RANDOM_ALPHABET) for _ in range(rng.randint(0, 80)))
+        assert get_words(text) == legacy_get_words(text), repr(text)
+
+
+@pytest.mark.skipif(not os.path.isfile(CORPUS_FILEPATH), reason="AG News corpus not available")
+def test_get_words_corpus():
+    """
+    The bulk tokenizer gives the same words as the reference tokenizer on every corpus row.
+    """
+    for text in pd.read_csv(CORPUS_FILEPATH)["text"]:
+        assert get_words(text) == legacy_get_words(text), text
+
+
+# ==================== PERSISTENCE ====================
+def write_corpus(filepath: str, texts: list) -> str:
+    """
+    Write a corpus file of the texts (all with the label 0).
+
+    Args:
+        1. filepath (str): the path of the .csv file.
+        2. texts (list): the texts of the rows.
+
+    Returns:
+        str: the path of the file.
+    """
+    pd.DataFrame({"text": texts, "label": 0}).to_csv(filepath, index=False)
+    return filepath
+
+
+@pytest.mark.parametrize("persist", PERSIST_POLICIES)
+@pytest.mark.parametrize("journal", [False, True])
+@pytest.mark.parametrize("storage", [STORAGE_TEXT, STORAGE_BINARY])
+def test_reload_after_flush(tmp_path, monkeypatch, persist, journal, storage):
+    """
+    After a delete removing more occurrences of a word than its freq, then an add, flush() writes
+    the vocabulary held in memory (with the journal, the updates are merged into one log record):
+    loading it back gives the same vocabulary.
+    """
+    monkeypatch.chdir(tmp_path)
+    corpus_filepath = write_corpus("corpus.csv", ["zebraword zebraword apple", "banana apple cherry"])
+    delete_filepath = write_corpus("delete.csv", ["zebraword " * 5 + "apple banana"])
+    add_filepath = write_corpus("add.csv", ["zebraword durian durian"])
+
+    tp = TextProcessor(STOPWORDS_FILEPATH, corpus_filepath, IDX2LABEL_FILEPATH,
+                       persist=persist, journal=journal, storage=storage)
+    tp.flush()
+    tp.delete_file(delete_filepath)
+    tp.add_file(add_filepath)
+    tp.flush()
+
+    word_freq = dict(tp.word_freq)
+    word2idx = dict(tp.word2idx)
+    assert word_freq == {"zebraword": 1, "apple": 1, "cherry": 1, "durian": 2}
+
+    tp.load()
+    assert dict(tp.word_freq) == word_freq
+    assert dict(tp.word2idx) == word2idx
+
+    # A new instance (not saving the corpus vocabulary over the files) loads the same vocabulary
+    reloaded = TextProcessor(STOPWORDS_FILEPATH, corpus_filepath, IDX2LABEL_FILEPATH,
+                             persist=PERSIST_NEVER, journal=journal, storage=storage)
+    reloaded.load()
+    assert dict(reloaded.word_freq) == word_freq
@@ -0,0 +1,145 @@
+"""
+Load benchmark for the vocabulary server of Task 8.
+
+Run with:
+    python bench_task8.py [--readers 50] [--queries 200] [--writers 1] [--updates 10] [--output results.json]
+(the server is started in a subprocess, from a temporary folder where it saves the vocabulary)
+
+Reader sessions send top / bottom queries while admin sessions add and delete a file, all at once.
+One JSON record is printed with the queries/sec and the p50 / p99 latency of the reads and the updates.
+"""
+import argparse
+import asyncio
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+# CONSTANTS - benchmark data
+TASK_PATH = os.path.dirname(os.path.abspath(__file__))
+DATA_PATH = os.path.join(TASK_PATH, "data")
+ADD_FILEPATH = os.path.join(DATA_PATH, "add.csv")
+
+# The timing helpers are shared by the benchmarks of the task folders
+sys.path.insert(0, os.path.dirname(TASK_PATH))
+from bench_common import summarize_latencies
+
+
+# ==================== LOAD GENERATOR ====================
+async def run_session(host: str, port: int, login: str, commands: List[str], latencies: List[float]) -> None:
+    """
+    Open one session, log in, then send the commands one at a time and record their latency.
+
+    Args:
+        1. host (str): the server address.
+        2. port (int): the server port.
+        3. login (str): the login command of the session.
+        4. commands (List[str]): the commands to send.
+        5. latencies (List[float]): the list the latency of each command is appended to.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+
+    for index, command in enumerate([login] + commands):
+        start = time.perf_counter()
+        writer.write((command + "\n").encode())
+        await writer.drain()
+        response = json.loads(await reader.readline())
+
+        if not response["ok"]:
+            raise RuntimeError(f"{command}: {response['error']}")
+        if index > 0:
+            latencies.append(time.perf_counter() - start)
+
+    writer.close()
+    await writer.wait_closed()
+
+
+async def run_load(host: str, port: int, args: argparse.Namespace) -> Dict[str, float]:
+    """
+    Run the reader and writer sessions concurrently.
+
+    Args:
+        1. host (str): the server address.
+        2. port (int): the server port.
+        3. args (argparse.Namespace): the benchmark options.
+
+    Returns:
+        Dict[str, float]: the queries/sec and the p50 / p99 latencies (ms) of the reads and updates.
+    """
+    read_latencies = []
+    write_latencies = []
+
+    read_commands = ["top 10" if index % 2 == 0 else "bottom 10" for index in range(args.queries)]
+    # Every add is followed by a delete of the same file, so the vocabulary size stays stable
+    write_commands = [
+        f"add {ADD_FILEPATH}" if index % 2 == 0 else f"delete {ADD_FILEPATH}" for index in range(args.updates)
+    ]
+
+    sessions = [
+        run_session(host, port, "login Jueqing jueqing123", read_commands, read_latencies)
+        for _ in range(args.readers)
+    ] + [
+        run_session(host, port, "login Trang trang123", write_commands, write_latencies)
+        for _ in range(args.writers)
+    ]
+
+    start = time.perf_counter()
+    await asyncio.gather(*sessions)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "queries_per_sec": round((len(read_latencies) + len(write_latencies)) / elapsed, 2),
+        **summarize_latencies(read_latencies, "read_"),
+        **summarize_latencies(write_latencies, "write_")
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse the command line options of the benchmark.
+
+    Returns:
+        argparse.Namespace: the benchmark options.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the vocabulary server under mixed load.")
+    parser.add_argument("--readers", type=int, default=50, help="number of concurrent reader sessions")
+    parser.add_argument("--queries", type=int, default=200, help="number of top / bottom queries per reader")
+    parser.add_argument("--writers", type=int, default=1, help="number of concurrent admin sessions")
+    parser.add_argument("--updates", type=int, default=10, help="number of add / delete updates per admin")
+    parser.add_argument("--output", help="JSON file the results are written to")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_path:
+        server = subprocess.Popen(
+            [sys.executable, os.path.join(TASK_PATH, "task8_server.py"), "--port", "0", "--data-dir", DATA_PATH],
+            cwd=tmp_path,
+            stdout=subprocess.PIPE,
+            text=True
+        )
+
+        try:
+            address = json.loads(server.stdout.readline())
+            result = {
+                "benchmark": "vocab_server",
+                "readers": args.readers,
+                "queries": args.queries,
+                "writers": args.writers,
+                "updates": args.updates,
+                **asyncio.run(run_load(address["host"], address["port"], args))
+            }
+        finally:
+            server.send_signal(signal.SIGTERM)
+            server.wait()
+
+    print(json.dumps(result))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
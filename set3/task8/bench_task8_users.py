@@ -0,0 +1,149 @@
+"""
+Benchmark of the user directory of Task 8.
+
+Run with:
+    python bench_task8_users.py [--users 100000] [--lookups 10000] [--iterations 1000] [--seed 9136] [--output results.json]
+(the user file is written to a temporary folder)
+
+A JSON user file of --users accounts (password hashes of --iterations PBKDF2 iterations) is loaded,
+then random user names (in random case) are looked up with the index of UserDirectory and with the
+linear scan of the former login, and some logins are checked (lookup and password hash).
+The same accounts are also given with plaintext passwords (hashed on their first login).
+One JSON record is printed with the load times and the latencies.
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import sys
+import time
+from typing import Dict, List, Optional
+
+from task8 import UserDirectory, hash_password
+
+# CONSTANTS - number of scanned lookups (the linear scan is too slow to run all the lookups)
+MAX_SCAN_LOOKUPS = 200
+
+# The timing helpers are shared by the benchmarks of the task folders
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bench_common import summarize_latencies, time_calls
+
+
+# ==================== USER FILE ====================
+def write_users_file(filepath: str, n_users: int, iterations: int, rng: random.Random) -> List[str]:
+    """
+    Write a JSON file of n_users accounts (with a password hash of the same password each,
+    the salts making every hash different).
+
+    Args:
+        1. filepath (str): the path of the .json file.
+        2. n_users (int): the number of accounts.
+        3. iterations (int): the number of PBKDF2 iterations of the password hashes.
+        4. rng (random.Random): the random generator of the roles.
+
+    Returns:
+        List[str]: the user names.
+    """
+    user_names = [f"User{index:06d}" for index in range(n_users)]
+    users_info = {
+        user_name: {
+            "role": rng.choice(("reader", "admin")),
+            "name": f"User {index}",
+            "password_hash": hash_password(f"{user_name.lower()}123", iterations)
+        }
+        for index, user_name in enumerate(user_names)
+    }
+
+    with open(filepath, "w") as f:
+        json.dump(users_info, f)
+    return user_names
+
+
+# ==================== BENCHMARKS ====================
+def scan_user(users_info: Dict[str, Dict[str, str]], user_name: str) -> Optional[Dict[str, str]]:
+    """
+    Find an account with the linear scan of the former RoleBasedVocabSys.login.
+
+    Args:
+        1. users_info (Dict[str, Dict[str, str]]): the accounts by user name.
+        2. user_name (str): the account name.
+
+    Returns:
+        Dict[str, str] | None: the account, None if not found.
+    """
+    uname = user_name.lower()
+    for key, value in users_info.items():
+        if key.lower() == uname:
+            return value
+    return None
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse the command line options of the benchmark.
+
+    Returns:
+        argparse.Namespace: the benchmark options.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the user directory lookups.")
+    parser.add_argument("--users", type=int, default=100_000, help="number of accounts")
+    parser.add_argument("--lookups", type=int, default=10_000, help="number of indexed lookups")
+    parser.add_argument("--iterations", type=int, default=1000,
+                        help="PBKDF2 iterations of the generated password hashes (kept low to write the file quickly)")
+    parser.add_argument("--seed", type=int, default=9136, help="seed of the random generator")
+    parser.add_argument("--output", help="JSON file the results are written to")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    rng = random.Random(args.seed)
+
+    with tempfile.TemporaryDirectory() as tmp_path:
+        users_filepath = os.path.join(tmp_path, "users.json")
+        user_names = write_users_file(users_filepath, args.users, args.iterations, rng)
+
+        start = time.perf_counter()
+        directory = UserDirectory.from_file(users_filepath)
+        load_seconds = time.perf_counter() - start
+
+        with open(users_filepath, "r") as f:
+            users_info = json.load(f)
+
+    # Look up existing users in random case, and some missing ones
+    queries = [
+        rng.choice(user_names).swapcase() if rng.random() < 0.5 else rng.choice(user_names)
+        for _ in range(args.lookups)
+    ]
+    queries[::10] = [f"missing{index}" for index in range(len(queries[::10]))]
+    logins = [(user_name, f"{user_name.lower()}123") for user_name in rng.sample(user_names, 100)]
+
+    # The same accounts with plaintext passwords: only hashed on the first login of each account
+    plaintext_users_info = {
+        user_name: {"role": user["role"], "name": user["name"], "password": f"{user_name.lower()}123"}
+        for user_name, user in users_info.items()
+    }
+    start = time.perf_counter()
+    plaintext_directory = UserDirectory(plaintext_users_info, args.iterations)
+    plaintext_load_seconds = time.perf_counter() - start
+
+    result = {
+        "benchmark": "user_directory",
+        "users": args.users,
+        "lookups": args.lookups,
+        "iterations": args.iterations,
+        "load_sec": round(load_seconds, 4),
+        "plaintext_load_sec": round(plaintext_load_seconds, 4),
+        "indexed_lookup": summarize_latencies(time_calls(directory.find_user, [(query,) for query in queries])),
+        "scan_lookup": summarize_latencies(
+            time_calls(scan_user, [(users_info, query) for query in queries[:MAX_SCAN_LOOKUPS]])
+        ),
+        "login": summarize_latencies(time_calls(directory.check_password, logins)),
+        "plaintext_first_login": summarize_latencies(time_calls(plaintext_directory.check_password, logins))
+    }
+
+    print(json.dumps(result))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
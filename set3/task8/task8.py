@@ -1,6 +1,46 @@
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, TextIO, Tuple
+import argparse
+import csv
+import hashlib
+import hmac
+import json
 import os
-from task7 import TextProcessor
+import shlex
+import sys
+from task7 import PERSIST_EAGER, PERSIST_NEVER, TextProcessor
+
+# CONSTANTS - number of words listed by the top / bottom commands when not given
+DEFAULT_LIST_SIZE = 10
+
+# CONSTANTS - menu choice of each command (for the role checks)
+COMMAND_CHOICES = {"logout": "2", "top": "3", "bottom": "4", "add": "5", "delete": "6"}
+
+# CONSTANTS - password hashing (PBKDF2-HMAC-SHA256, stored as "<scheme>$<iterations>$<salt>$<hash>")
+PASSWORD_SCHEME = "pbkdf2_sha256"
+PASSWORD_ITERATIONS = 100_000
+PASSWORD_SALT_SIZE = 16
+
+# CONSTANTS - columns of the user files (the password column may be replaced by password_hash)
+USER_FIELDS = ("user_name", "role", "name")
+
+# CONSTANTS - accounts of the system
+DEFAULT_USERS_INFO = {
+    "Jueqing": {
+        "role": "reader",
+        "password": "jueqing123",
+        "name": "Jueqing Lu"
+    },
+    "Trang": {
+        "role": "admin",
+        "password": "trang123",
+        "name": "Trang Vu"
+    },
+    "land": {
+        "role": "admin",
+        "password": "landu123",
+        "name": "Lan Du"
+    }
+}
 
 class Role:
     """
@@ -56,22 +96,280 @@ class Role:
         return self.name
 
 
+# ==================== USER DIRECTORY ====================
+def hash_password(password: str, iterations: int = PASSWORD_ITERATIONS, salt: Optional[bytes] = None) -> str:
+    """
+    Hash a password with a random salt.
+
+    Args:
+        1. password (str): the plaintext password.
+        2. iterations (int): the number of PBKDF2 iterations.
+        3. salt (bytes | None): the salt (default: random).
+
+    Returns:
+        str: the password hash, "<scheme>$<iterations>$<salt hex>$<hash hex>".
+    """
+    if salt is None:
+        salt = os.urandom(PASSWORD_SALT_SIZE)
+
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, iterations)
+    return f"{PASSWORD_SCHEME}${iterations}${salt.hex()}${digest.hex()}"
+
+
+def parse_password_hash(password_hash: str) -> Tuple[int, bytes, bytes]:
+    """
+    Split a hash of hash_password into its parts.
+
+    Args:
+        1. password_hash (str): the password hash.
+
+    Returns:
+        Tuple[int, bytes, bytes]: the number of PBKDF2 iterations, the salt and the digest.
+        Raises ValueError if the hash is malformed or of another scheme.
+    """
+    parts = password_hash.split("$") if isinstance(password_hash, str) else []
+    if len(parts) != 4 or parts[0] != PASSWORD_SCHEME:
+        raise ValueError(f"Unsupported password hash (expected {PASSWORD_SCHEME}$<iterations>$<salt>$<hash>)")
+
+    _, iterations, salt, digest = parts
+    if not iterations.isdigit() or int(iterations) < 1:
+        raise ValueError(f"Invalid number of iterations in password hash: {iterations}")
+
+    return int(iterations), bytes.fromhex(salt), bytes.fromhex(digest)
+
+
+def verify_password(password: str, password_hash: str) -> bool:
+    """
+    Check a password against a hash of hash_password (in constant time).
+    A malformed hash never matches.
+
+    Args:
+        1. password (str): the plaintext password.
+        2. password_hash (str): the stored password hash.
+
+    Returns:
+        bool: True if the password matches, False otherwise.
+    """
+    try:
+        iterations, salt, digest = parse_password_hash(password_hash)
+    except ValueError:
+        return False
+
+    candidate = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, iterations)
+    return hmac.compare_digest(candidate, digest)
+
+
+class UserDirectory:
+    """
+    User Directory Class - the accounts of the system, indexed by their casefolded user name
+    (O(1) case insensitive lookup), with salted password hashes instead of plaintext passwords.
+
+    Hashing a password costs about 40 ms at PASSWORD_ITERATIONS, so the plaintext passwords given to the
+    directory are only hashed on the first login of their account (or on save): loading tens of thousands
+    of accounts stays fast. Accounts given with their password_hash (e.g. a file written by save) are never
+    hashed again.
+
+    Instance Variables:
+        1. users (Dict[str, Dict[str, str]]): The accounts (user_name, role, name, password_hash)
+        by casefolded user name (password_hash is None until the plaintext password is hashed).
+        2. pending_passwords (Dict[str, Tuple[str, int]]): The plaintext passwords not hashed yet and
+        their number of PBKDF2 iterations, by casefolded user name.
+    """
+
+    def __init__(self, users_info: Optional[Dict[str, Dict[str, str]]] = None,
+                 iterations: int = PASSWORD_ITERATIONS) -> None:
+        """
+        ========== UserDirectory Constructor ==========
+
+        Initialise a UserDirectory instance (the plaintext passwords of users_info are hashed lazily).
+
+        Args:
+            1. users_info (Dict[str, Dict[str, str]] | None): the accounts by user name, with their
+            role, name and password (or password_hash).
+            2. iterations (int): the number of PBKDF2 iterations of the hashed passwords.
+        """
+        self.users = {}
+        self.pending_passwords = {}
+
+        for user_name, user in (users_info or {}).items():
+            self.add_user(user_name, user["role"], user["name"],
+                          password=user.get("password"), password_hash=user.get("password_hash"),
+                          iterations=iterations)
+
+    @classmethod
+    def from_file(cls, filepath: str, iterations: int = PASSWORD_ITERATIONS) -> "UserDirectory":
+        """
+        Load the accounts of a JSON file (same layout as users_info) or of a CSV file
+        (columns user_name, role, name and password or password_hash).
+
+        Args:
+            1. filepath (str): the path of the .json / .csv file.
+            2. iterations (int): the number of PBKDF2 iterations of the plaintext passwords.
+
+        Returns:
+            UserDirectory: the directory of the accounts.
+        """
+        if filepath.endswith(".json"):
+            with open(filepath, "r") as f:
+                return cls(json.load(f), iterations)
+
+        if not filepath.endswith(".csv"):
+            raise ValueError(f"Unsupported user file (expected .json or .csv): {filepath}")
+
+        directory = cls()
+        with open(filepath, "r", newline="") as f:
+            for row in csv.DictReader(f):
+                directory.add_user(row["user_name"], row["role"], row["name"],
+                                   password=row.get("password") or None,
+                                   password_hash=row.get("password_hash") or None,
+                                   iterations=iterations)
+        return directory
+
+    def save(self, filepath: str) -> None:
+        """
+        Write the accounts, with their password hashes only, to a JSON file (readable by from_file).
+        The plaintext passwords not hashed yet are hashed first.
+
+        Args:
+            1. filepath (str): the path of the .json file.
+        """
+        users_info = {
+            user["user_name"]: {
+                "role": user["role"],
+                "name": user["name"],
+                "password_hash": self._get_password_hash(key)
+            }
+            for key, user in self.users.items()
+        }
+        with open(filepath, "w") as f:
+            json.dump(users_info, f, indent=2)
+
+    def add_user(
+            self,
+            user_name: str,
+            role: str,
+            name: str,
+            password: Optional[str] = None,
+            password_hash: Optional[str] = None,
+            iterations: int = PASSWORD_ITERATIONS
+        ) -> None:
+        """
+        Add an account, given either its plaintext password (hashed on the first login of the account)
+        or its password hash.
+
+        Args:
+            1. user_name (str): the account name.
+            2. role (str): the access level ("reader" or "admin").
+            3. name (str): the full name.
+            4. password (str | None): the plaintext password.
+            5. password_hash (str | None): the password hash (from hash_password, checked here).
+            6. iterations (int): the number of PBKDF2 iterations of the plaintext password.
+        """
+        key = user_name.casefold()
+        if key in self.users:
+            raise ValueError(f"Duplicate user name (case insensitive): {user_name}")
+
+        if password_hash is None:
+            if password is None:
+                raise ValueError(f"Missing password of user: {user_name}")
+            self.pending_passwords[key] = (password, iterations)
+        else:
+            # Reject a malformed hash when the account is loaded, not on its first login
+            try:
+                parse_password_hash(password_hash)
+            except ValueError as error:
+                raise ValueError(f"Invalid password hash of user {user_name}: {error}") from None
+
+        self.users[key] = {
+            "user_name": user_name,
+            "role": role,
+            "name": name,
+            "password_hash": password_hash
+        }
+
+    def find_user(self, user_name: str) -> Optional[Dict[str, str]]:
+        """
+        Find an account by its name (case insensitive).
+
+        Args:
+            1. user_name (str): the account name.
+
+        Returns:
+            Dict[str, str] | None: the account (user_name, role, name, password_hash), None if not found.
+        """
+        return self.users.get(user_name.casefold())
+
+    def check_password(self, user_name: str, password: str) -> bool:
+        """
+        Check the password of an account (hashing its plaintext password on its first login).
+
+        Args:
+            1. user_name (str): the account name (case insensitive).
+            2. password (str): the plaintext password to check.
+
+        Returns:
+            bool: True if the account exists and the password matches, False otherwise.
+        """
+        key = user_name.casefold()
+        if key not in self.users:
+            return False
+
+        return verify_password(password, self._get_password_hash(key))
+
+    def _get_password_hash(self, key: str) -> str:
+        """
+        Get the password hash of an account, hashing its plaintext password if not done yet.
+        Safe to call from several threads: an account hashed twice at once keeps one of the (valid) hashes.
+
+        Args:
+            1. key (str): the casefolded account name.
+
+        Returns:
+            str: the password hash.
+        """
+        user = self.users[key]
+        password_hash = user["password_hash"]
+        if password_hash is not None:
+            return password_hash
+
+        pending = self.pending_passwords.get(key)
+        if pending is None:
+            # Hashed by another thread in the meantime
+            return user["password_hash"]
+
+        password_hash = hash_password(*pending)
+        user["password_hash"] = password_hash
+        self.pending_passwords.pop(key, None)
+        return password_hash
+
+    def __len__(self) -> int:
+        """
+        Get the number of accounts.
+
+        Returns:
+            int: the number of accounts.
+        """
+        return len(self.users)
+
+
 class RoleBasedVocabSys:
     """
     RoleBasedVocabSys class to define instance of role-based vocabulary system.
     
     Instance Variables:
-        1. users_info (dict): Dictionary of collection of users
-        2. current_user (Role): current user log in
-        3. text_processor (TextProcessor): Text processor
-        4. exit (boolean): Check is system exit or not.
+        1. users_info (dict | UserDirectory): Collection of users, as given to the constructor
+        2. user_directory (UserDirectory): Directory of the users (hashed passwords), used for the logins
+        3. current_user (Role): current user log in
+        4. text_processor (TextProcessor): Text processor
+        5. exit (boolean): Check is system exit or not.
     """
     def __init__(
             self,
             users_info,
             stopwords_filepath,
             corpus_filepath,
-            idx2label_filepath
+            idx2label_filepath,
+            snapshots=False
     ):
         # YOUR CODES START HERE
         """
@@ -80,16 +378,24 @@ class RoleBasedVocabSys:
         Initialise a RoleBasedVocabSys instance
         
         Args:
-            1. users_info: Dictionary of collection of users.
+            1. users_info: Dictionary of collection of users (indexed into a UserDirectory, whose passwords
+            are hashed on the first login of each user), or a UserDirectory.
             2. stopwords_filepath: Path of stopwords file.
             3. corpus_filepath: Path of corpus file.
             4. idx2label_filepath: Path of idx2label file.
+            5. snapshots: Whether the text processor publishes vocabulary snapshots, for readers
+            running concurrently with the updates (default: False).
         """
         self.users_info = users_info
+        self.user_directory = users_info if isinstance(users_info, UserDirectory) else UserDirectory(users_info)
         self.current_user = None
         self.text_processor = TextProcessor(stopwords_filepath,
                                             corpus_filepath,
-                                            idx2label_filepath)
+                                            idx2label_filepath,
+                                            lazy_corpus=True,
+                                            corpus_cache=True,
+                                            persist=PERSIST_EAGER,
+                                            snapshots=snapshots)
 
     def start(self):
         # YOUR CODES START HERE
@@ -119,10 +425,8 @@ class RoleBasedVocabSys:
                     self.login()
                 continue
 
-            # Get user access for different menu choices and word list for according actions
+            # Get user access for different menu choices
             access = self.current_user.get_access()
-            word_freq = self.text_processor.get_word_freq()
-            word_list = self.text_processor.get_word_sorted_by_freq(word_freq)
 
             # Action when user log in for both reader and admin
             if user_choice == "1":
@@ -135,14 +439,14 @@ class RoleBasedVocabSys:
             # Print top 10 frequency words
             elif user_choice == "3":
                 print("====================")
-                for wrd, frq in word_list[:10]:
+                for wrd, frq in self.text_processor.get_top_words(10):
                     print(f"{wrd} {frq}")
                 print("====================")
                 continue
             # Print bottom 10 frequency words
             elif user_choice == "4":
                 print("====================")
-                for wrd, frq in word_list[-10:]:
+                for wrd, frq in self.text_processor.get_bottom_words(10):
                     print(f"{wrd} {frq}")
                 print("====================")
                 continue
@@ -161,6 +465,142 @@ class RoleBasedVocabSys:
                     print("done.")
                     continue
 
+    def run_commands(self, commands: Iterable[str], output: TextIO = sys.stdout) -> List[Dict]:
+        """
+        This function runs the system non-interactively from a stream of commands (one per line):
+            - login <user name> <password>
+            - logout
+            - add <file path> ...       (admin only)
+            - delete <file path> ...    (admin only)
+            - top [k]                   (default: 10)
+            - bottom [k]                (default: 10)
+        The lines are split like a shell command line, so paths holding spaces can be quoted, and the files
+        of an add / delete are applied in order.
+        Blank lines and lines starting with "#" are skipped, and a failed command is reported and skipped.
+        The vocabulary updates are only kept in memory while the commands run, and written once, by a single
+        flush at the end. If the run is aborted (an exception stops it), the updates are rolled back and
+        nothing is written.
+
+        Args:
+            1. commands (Iterable[str]): The command lines (e.g. a command file or sys.stdin).
+            2. output (TextIO): Stream the result of each command is written to, as a JSON line (default: stdout).
+
+        Returns:
+            List[Dict]: The result of each command: its line number, command name and "ok" flag,
+            with the "words" of the top / bottom commands or the "error" of a failed command.
+        """
+        results = []
+        text_processor = self.text_processor
+        persist = text_processor.persist
+        text_processor.persist = PERSIST_NEVER
+
+        # Vocabulary before the first update of the run (to roll back an aborted run)
+        word_freq = None
+
+        try:
+            for line_number, line in enumerate(commands, start=1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+
+                try:
+                    command, *args = shlex.split(line)
+                    parse_error = None
+                except ValueError as exception:
+                    command, args = line.split()[0], []
+                    parse_error = f"invalid command line: {exception}"
+                result = {"line": line_number, "command": command}
+
+                if command in ("add", "delete") and word_freq is None:
+                    word_freq = dict(text_processor.word_freq)
+
+                try:
+                    error = parse_error or self._run_command(command, args, result)
+                except Exception as exception:
+                    error = f"{command} failed: {exception}"
+
+                result["ok"] = error is None
+                if error is not None:
+                    result["error"] = error
+
+                results.append(result)
+                output.write(json.dumps(result) + "\n")
+        except BaseException:
+            if word_freq is not None:
+                text_processor.set_word_freq(word_freq)
+            raise
+        finally:
+            text_processor.persist = persist
+
+        text_processor.flush()
+        return results
+
+    def _run_command(self, command: str, args: List[str], result: Dict) -> Optional[str]:
+        """
+        This function runs one command of run_commands.
+
+        Args:
+            1. command (str): The command name.
+            2. args (List[str]): The command arguments.
+            3. result (Dict): The result of the command, completed with the listed words.
+
+        Returns:
+            Optional[str]: The error message if the command failed, None otherwise.
+        """
+        if command == "login":
+            if len(args) != 2:
+                return "usage: login <user name> <password>"
+
+            user, error = self._authenticate(*args)
+            if user is None:
+                return error
+
+            self.current_user = user
+            result["user"] = user.get_user_name()
+            return None
+
+        if command not in COMMAND_CHOICES:
+            return f"unknown command: {command}"
+
+        if self.current_user is None:
+            return "not logged in"
+
+        if not self.is_choice_allowed(self.current_user, COMMAND_CHOICES[command]):
+            return "permission denied"
+
+        if command == "logout":
+            self.current_user = None
+            return None
+
+        if command in ("top", "bottom"):
+            if len(args) > 1 or (args and not args[0].isdigit()):
+                return f"usage: {command} [k]"
+
+            k = int(args[0]) if args else DEFAULT_LIST_SIZE
+            if command == "top":
+                words = self.text_processor.get_top_words(k)
+            else:
+                words = self.text_processor.get_bottom_words(k)
+
+            result["words"] = [[word, freq] for word, freq in words]
+            return None
+
+        # add / delete (every file is checked before the first one is applied)
+        if not args:
+            return f"usage: {command} <file path> ..."
+
+        for file_path in args:
+            if not os.path.isfile(file_path):
+                return f"file not found: {file_path}"
+
+        for file_path in args:
+            if command == "add":
+                self.text_processor.add_file(file_path)
+            else:
+                self.text_processor.delete_file(file_path)
+
+        return None
+
     def _check_existing_path(self,prompt: str) -> str:
         """
         Check if path exists.
@@ -226,15 +666,29 @@ class RoleBasedVocabSys:
         Returns:
             bool: True if user choice is valid, False otherwise.
         """
+        return self.is_choice_allowed(self.current_user, user_choice)
+
+    @staticmethod
+    def is_choice_allowed(user: Optional[Role], user_choice: str) -> bool:
+        """
+        This function checks a menu choice is allowed for a user (or when nobody is logged in).
+        
+        Args:
+            1. user (Role | None): the logged in user, None if nobody is logged in.
+            2. user_choice (str): the menu choice from 1 to 6.
+
+        Returns:
+            bool: True if the choice is allowed, False otherwise.
+        """
         # List of choice
         choices = ["1", "2", "3", "4", "5", "6"]
-        if self.current_user is None:
+        if user is None:
             return user_choice in choices[:2]
         # Verify for reader
-        elif self.current_user.get_access() == "reader":
+        elif user.get_access() == "reader":
             return user_choice in choices[:4]
         # Verify for admin
-        elif self.current_user.get_access() == "admin":
+        elif user.get_access() == "admin":
             return user_choice in choices
         else:
             return False
@@ -263,49 +717,58 @@ class RoleBasedVocabSys:
         username_in = input("Please key your account name: ").strip()
         password = input("Please key your password: ").strip()
 
-        uname = username_in.lower()
-        matched_key = None
-        user = None
-        for key, value in self.users_info.items():
-            if key.lower() == uname:
-                matched_key, user = key, value
-                break
+        user, error = self._authenticate(username_in, password)
+        if user is None:
+            print(f"Login failed: {error}.")
+            return
+
+        print(f"Welcome {user.get_name()}")
+        self.current_user = user
+
+    def _authenticate(self, username_in: str, password: str) -> Tuple[Optional[Role], Optional[str]]:
+        """
+        This function checks the account name (case insensitive) and the password of a user.
+
+        Args:
+            1. username_in (str): The account name.
+            2. password (str): The password.
+
+        Returns:
+            Tuple[Optional[Role], Optional[str]]: The logged in user and None,
+            or None and the reason of the failure.
+        """
+        user = self.user_directory.find_user(username_in)
 
         if not user:
-            print("Login failed: user not found.")
-            return
-        if user.get("password") != password:
-            print("Login failed: wrong password.")
-            return
+            return None, "user not found"
+        if not self.user_directory.check_password(username_in, password):
+            return None, "wrong password"
 
-        print(f"Welcome {user['name']}")
-        self.current_user = Role(
-            user_name=matched_key,
+        return Role(
+            user_name=user["user_name"],
             name=user["name"],
             access=user["role"]
-        )
+        ), None
 
 
 if __name__ == "__main__":
-    users_info = {
-        "Jueqing": {
-            "role": "reader",
-            "password": "jueqing123",
-            "name": "Jueqing Lu"
-        },
-        "Trang": {
-            "role": "admin",
-            "password": "trang123",
-            "name": "Trang Vu"
-        },
-        "land": {
-            "role": "admin",
-            "password": "landu123",
-            "name": "Lan Du"
-        }
+    parser = argparse.ArgumentParser(description="Role based vocabulary system.")
+    parser.add_argument("--batch", metavar="COMMAND_FILE",
+                        help="run the commands of the file (\"-\" for stdin) instead of the interactive menu")
+    parser.add_argument("--users", metavar="USERS_FILE",
+                        help="load the accounts from a .json / .csv file instead of the default accounts")
+    args = parser.parse_args()
+
+    users_info = UserDirectory.from_file(args.users) if args.users else DEFAULT_USERS_INFO
 
-    }
     a_sys = RoleBasedVocabSys(users_info, stopwords_filepath="data/stop_words_english.txt",
                               corpus_filepath="data/ag_news_test.csv",
                               idx2label_filepath="data/idx2label.json")
-    a_sys.start()
\ No newline at end of file
+
+    if args.batch is None:
+        a_sys.start()
+    elif args.batch == "-":
+        a_sys.run_commands(sys.stdin)
+    else:
+        with open(args.batch, "r") as f:
+            a_sys.run_commands(f)
\ No newline at end of file
@@ -0,0 +1,333 @@
+"""
+Multi-user server mode of the role based vocabulary system of Task 8.
+
+Run with:
+    python task8_server.py [--host 127.0.0.1] [--port 9136] [--data-dir data] [--users users.json]
+
+Clients connect over TCP and send the commands of RoleBasedVocabSys.run_commands, one per line
+(login <user name> <password>, logout, top [k], bottom [k], add <file path>, delete <file path>).
+Each connection is its own session (logged in user), and every command is answered by one JSON line.
+"""
+import argparse
+import asyncio
+import json
+import os
+import signal
+from typing import Dict, List, Optional, Tuple
+
+from task7 import SNAPSHOT_LIST_SIZE, VocabSnapshot
+from task8 import COMMAND_CHOICES, DEFAULT_LIST_SIZE, DEFAULT_USERS_INFO, Role, RoleBasedVocabSys, UserDirectory
+
+
+class VocabServer:
+    """
+    Vocabulary Server Class - serves many concurrent sessions against the TextProcessor of one
+    RoleBasedVocabSys (built with snapshots). Reads are answered from the last VocabSnapshot published
+    by the text processor, and the add / delete updates are queued and applied one at a time by a
+    single writer, in a worker thread, which publishes a new snapshot once each update is complete.
+
+    Instance Variables:
+        1. vocab_sys (RoleBasedVocabSys): The system holding the users and the text processor.
+        2. host (str): The address the server listens on.
+        3. port (int): The port the server listens on (the bound port once started).
+        4. updates (asyncio.Queue): The pending (command, file path, future) updates.
+    """
+
+    def __init__(self, vocab_sys: RoleBasedVocabSys, host: str = "127.0.0.1", port: int = 9136) -> None:
+        """
+        ========== VocabServer Constructor ==========
+
+        Initialise a VocabServer instance.
+
+        Args:
+            1. vocab_sys (RoleBasedVocabSys): the system holding the users and the text processor
+            (which must publish snapshots).
+            2. host (str): the address to listen on.
+            3. port (int): the port to listen on (0: any free port).
+        """
+        self.vocab_sys = vocab_sys
+        self.host = host
+        self.port = port
+        self.updates = None
+        self._server = None
+        self._writer_task = None
+        self._clients = set()
+
+    async def start(self) -> None:
+        """
+        Start listening and the writer task.
+        """
+        self.updates = asyncio.Queue()
+        self._writer_task = asyncio.create_task(self._run_writer())
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """
+        Serve the clients until the server is cancelled, then stop it.
+        """
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def stop(self) -> None:
+        """
+        Stop listening, wait for the queued updates and write the vocabulary.
+        """
+        if self._server is not None:
+            self._server.close()
+            for client in list(self._clients):
+                client.close()
+            await self._server.wait_closed()
+            self._server = None
+
+        if self._writer_task is not None:
+            await self.updates.join()
+            self._writer_task.cancel()
+            self._writer_task = None
+
+        self.vocab_sys.text_processor.flush()
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Run the session of one client: answer each command line with a JSON line.
+
+        Args:
+            1. reader (asyncio.StreamReader): the stream of the client commands.
+            2. writer (asyncio.StreamWriter): the stream of the responses.
+        """
+        user = None
+        self._clients.add(writer)
+
+        try:
+            while True:
+                line, error = await self._read_line(reader)
+                if line is None:
+                    break
+
+                result = {}
+                if error is None:
+                    try:
+                        line = line.decode().strip()
+                    except UnicodeDecodeError:
+                        error = "invalid UTF-8 line"
+
+                if error is None:
+                    if not line or line.startswith("#"):
+                        continue
+
+                    command, *args = line.split()
+                    result["command"] = command
+                    try:
+                        user, error = await self._run_command(user, command, args, result)
+                    except Exception as exception:
+                        error = f"{command} failed: {exception}"
+
+                result["ok"] = error is None
+                if error is not None:
+                    result["error"] = error
+
+                writer.write((json.dumps(result) + "\n").encode())
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._clients.discard(writer)
+            writer.close()
+
+    async def _read_line(self, reader: asyncio.StreamReader) -> Tuple[Optional[bytes], Optional[str]]:
+        """
+        Read the next command line of a client. A line over the stream limit is read to its end and dropped.
+
+        Args:
+            1. reader (asyncio.StreamReader): the stream of the client commands.
+
+        Returns:
+            Tuple[Optional[bytes], Optional[str]]: the line (None at the end of the stream),
+            and the error message if the line was dropped (None otherwise).
+        """
+        try:
+            return await reader.readuntil(b"\n"), None
+        except asyncio.IncompleteReadError as error:
+            # Last line without a line break
+            return error.partial or None, None
+        except asyncio.LimitOverrunError as error:
+            consumed = error.consumed
+
+        # Drop the rest of the line, limit by limit
+        while True:
+            try:
+                await reader.readexactly(consumed)
+                await reader.readuntil(b"\n")
+                break
+            except asyncio.IncompleteReadError:
+                break
+            except asyncio.LimitOverrunError as error:
+                consumed = error.consumed
+
+        return b"", "line too long"
+
+    async def _run_command(
+            self,
+            user: Optional[Role],
+            command: str,
+            args: List[str],
+            result: Dict
+        ) -> Tuple[Optional[Role], Optional[str]]:
+        """
+        Run one command of a session, with the same role checks as RoleBasedVocabSys.
+
+        Args:
+            1. user (Role | None): the logged in user of the session.
+            2. command (str): the command name.
+            3. args (List[str]): the command arguments.
+            4. result (Dict): the result of the command, completed with the listed words.
+
+        Returns:
+            Tuple[Optional[Role], Optional[str]]: the logged in user after the command,
+            and the error message if the command failed (None otherwise).
+        """
+        if command == "login":
+            if len(args) != 2:
+                return user, "usage: login <user name> <password>"
+
+            # Check the password hash in a worker thread (PBKDF2 would stall the other sessions)
+            logged_user, error = await asyncio.get_running_loop().run_in_executor(
+                None, self.vocab_sys._authenticate, *args
+            )
+            if logged_user is None:
+                return user, error
+
+            result["user"] = logged_user.get_user_name()
+            return logged_user, None
+
+        if command not in COMMAND_CHOICES:
+            return user, f"unknown command: {command}"
+
+        if user is None:
+            return user, "not logged in"
+
+        if not RoleBasedVocabSys.is_choice_allowed(user, COMMAND_CHOICES[command]):
+            return user, "permission denied"
+
+        if command == "logout":
+            return None, None
+
+        if command in ("top", "bottom"):
+            if len(args) > 1 or (args and not args[0].isdigit()):
+                return user, f"usage: {command} [k]"
+
+            k = int(args[0]) if args else DEFAULT_LIST_SIZE
+            if k > SNAPSHOT_LIST_SIZE:
+                return user, f"k must be at most {SNAPSHOT_LIST_SIZE}"
+
+            # Read the last published snapshot (never modified, only replaced by the writer)
+            snapshot = self.vocab_sys.text_processor.get_snapshot()
+            words = snapshot.get_top_words(k) if command == "top" else snapshot.get_bottom_words(k)
+
+            result["version"] = snapshot.version
+            result["words"] = [[word, freq] for word, freq in words]
+            return user, None
+
+        # add / delete
+        if len(args) != 1:
+            return user, f"usage: {command} <file path>"
+
+        if not os.path.isfile(args[0]):
+            return user, f"file not found: {args[0]}"
+
+        # Queue the update for the writer and wait until it is applied
+        done = asyncio.get_running_loop().create_future()
+        await self.updates.put((command, args[0], done))
+        result["version"] = await done
+
+        return user, None
+
+    async def _run_writer(self) -> None:
+        """
+        Apply the queued updates one at a time, in a worker thread so the sessions keep being served.
+        """
+        loop = asyncio.get_running_loop()
+
+        while True:
+            command, file_path, done = await self.updates.get()
+
+            # The waiting session may be gone (its future cancelled): the update is still applied
+            try:
+                snapshot = await loop.run_in_executor(None, self._apply_update, command, file_path)
+            except Exception as error:
+                if not done.done():
+                    done.set_exception(error)
+            else:
+                if not done.done():
+                    done.set_result(snapshot.version)
+            finally:
+                self.updates.task_done()
+
+    def _apply_update(self, command: str, file_path: str) -> VocabSnapshot:
+        """
+        Apply one update to the vocabulary, which publishes the snapshot of the new version
+        (run by the writer only, in a worker thread).
+
+        Args:
+            1. command (str): "add" or "delete".
+            2. file_path (str): the path of the file to add / delete.
+
+        Returns:
+            VocabSnapshot: the snapshot published after the update.
+        """
+        text_processor = self.vocab_sys.text_processor
+
+        if command == "add":
+            text_processor.add_file(file_path)
+        else:
+            text_processor.delete_file(file_path)
+
+        return text_processor.get_snapshot()
+
+
+async def main(host: str, port: int, data_dir: str, users_filepath: Optional[str] = None) -> None:
+    """
+    Start the server and serve the clients until interrupted.
+
+    Args:
+        1. host (str): the address to listen on.
+        2. port (int): the port to listen on (0: any free port).
+        3. data_dir (str): the folder of the stopwords, corpus and idx2label files.
+        4. users_filepath (str | None): the .json / .csv file of the accounts (default: the default accounts).
+    """
+    vocab_sys = RoleBasedVocabSys(
+        UserDirectory.from_file(users_filepath) if users_filepath else DEFAULT_USERS_INFO,
+        stopwords_filepath=os.path.join(data_dir, "stop_words_english.txt"),
+        corpus_filepath=os.path.join(data_dir, "ag_news_test.csv"),
+        idx2label_filepath=os.path.join(data_dir, "idx2label.json"),
+        snapshots=True
+    )
+    server = VocabServer(vocab_sys, host, port)
+    await server.start()
+
+    # Stop gracefully (writing the vocabulary) on SIGINT / SIGTERM
+    serving = asyncio.create_task(server.serve_forever())
+    loop = asyncio.get_running_loop()
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signal_number, serving.cancel)
+
+    # Announce the bound address (machine readable, e.g. for the benchmark)
+    print(json.dumps({"host": server.host, "port": server.port}), flush=True)
+
+    try:
+        await serving
+    except asyncio.CancelledError:
+        pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Multi-user role based vocabulary server.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=9136, help="port to listen on (0: any free port)")
+    parser.add_argument("--data-dir", default="data", help="folder of the corpus files")
+    parser.add_argument("--users", help="load the accounts from a .json / .csv file")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.host, args.port, args.data_dir, args.users))
@@ -0,0 +1,206 @@
+"""
+Benchmarks for the EssayScorer of Task 9.
+
+Run with:
+    python bench_task9.py [--batch-sizes 100,1000] [--words 400] [--stopword-ratio 0.4]
+                          [--rare-ratio 0.1] [--unknown-ratio 0.02] [--seed 9136] [--output results.json] [--stages]
+(the essays are written to a temporary folder)
+
+One JSON record is printed per batch size (and written to --output as a JSON list),
+so that the results can be compared across releases.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import string
+import sys
+import tempfile
+import time
+from itertools import accumulate
+from typing import Dict, List
+
+from task9 import EssayScorer, ScoringStats, TextProcessor
+
+# CONSTANTS - benchmark data
+DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+STOPWORDS_FILEPATH = os.path.join(DATA_PATH, "stop_words_english.txt")
+CORPUS_FILEPATH = os.path.join(DATA_PATH, "ag_news_test.csv")
+IDX2LABEL_FILEPATH = os.path.join(DATA_PATH, "idx2label.json")
+PROB_STATEMENT = "The impact of technology on education."
+
+# The timing helpers are shared by the benchmarks of the task folders
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bench_common import summarize_latencies, time_calls
+
+
+# ==================== SYNTHETIC ESSAYS ====================
+class EssayGenerator:
+    """
+    Essay Generator Class - synthetic essays mixing stopwords, common and rare corpus words
+    and unknown words in controlled proportions.
+
+    Instance Variables:
+        1. stopwords (List[str]): The stopwords of the text processor.
+        2. common_words (List[str]): The corpus words appearing more than 3 times.
+        3. common_cum_weights (List[int]): The cumulative corpus frequency of the common words (sampling weights).
+        4. rare_words (List[str]): The corpus words appearing 1 to 3 times.
+        5. rng (random.Random): The random generator of the essays.
+    """
+
+    def __init__(self, tp: TextProcessor, seed: int) -> None:
+        """
+        ========== EssayGenerator Constructor ==========
+
+        Split the vocabulary of the text processor (built from the AG News corpus) into
+        common and rare words.
+
+        Args:
+            1. tp (TextProcessor): the text processor holding the corpus vocabulary.
+            2. seed (int): the seed of the random generator.
+        """
+        word_freq = tp.get_word_freq()
+
+        self.stopwords = sorted(tp.get_stopword_index())
+        self.common_words = [word for word, freq in word_freq.items() if freq > 3]
+        self.common_cum_weights = list(accumulate(word_freq[word] for word in self.common_words))
+        self.rare_words = [word for word, freq in word_freq.items() if freq <= 3]
+        self.rng = random.Random(seed)
+
+    def generate(self, n_words: int, stopword_ratio: float, rare_ratio: float, unknown_ratio: float) -> str:
+        """
+        Generate one essay of n_words words.
+
+        Args:
+            1. n_words (int): number of words of the essay.
+            2. stopword_ratio (float): proportion of stopwords.
+            3. rare_ratio (float): proportion of rare corpus words (1 to 3 occurrences).
+            4. unknown_ratio (float): proportion of words missing from the corpus.
+            (the rest are common corpus words, sampled by their corpus frequency)
+
+        Returns:
+            str: the essay text.
+        """
+        rng = self.rng
+        words = []
+
+        for _ in range(n_words):
+            draw = rng.random()
+            if draw < stopword_ratio:
+                words.append(rng.choice(self.stopwords))
+            elif draw < stopword_ratio + rare_ratio:
+                words.append(rng.choice(self.rare_words))
+            elif draw < stopword_ratio + rare_ratio + unknown_ratio:
+                words.append("".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(8, 12))))
+            else:
+                words.append(rng.choices(self.common_words, cum_weights=self.common_cum_weights)[0])
+
+        # Break the words into sentences
+        sentences = [" ".join(words[start:start + 15]) for start in range(0, len(words), 15)]
+        return ". ".join(sentence.capitalize() for sentence in sentences) + "."
+
+
+# ==================== BENCHMARKS ====================
+def get_peak_rss_mb() -> float:
+    """
+    Get the peak resident set size of the process, in MB.
+
+    Returns:
+        float: the peak RSS.
+    """
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # ru_maxrss is in bytes on macOS and in KB elsewhere
+    if sys.platform == "darwin":
+        return peak_rss / (1 << 20)
+    return peak_rss / (1 << 10)
+
+
+def bench_scoring(scorer: EssayScorer, paths: List[str], prob_statement: str) -> Dict[str, float]:
+    """
+    Score the essays one by one with score_essay and measure the throughput and latencies.
+
+    Args:
+        1. scorer (EssayScorer): the essay scorer.
+        2. paths (List[str]): the paths of the essays.
+        3. prob_statement (str): the problem statement of the essays.
+
+    Returns:
+        Dict[str, float]: the essays/sec, p50 / p99 latency per essay (ms) and peak RSS (MB).
+    """
+    start = time.perf_counter()
+    latencies = time_calls(scorer.score_essay, [(prob_statement, file_path) for file_path in paths])
+    elapsed = time.perf_counter() - start
+
+    return {
+        "essays_per_sec": round(len(paths) / elapsed, 2),
+        **summarize_latencies(latencies),
+        "peak_rss_mb": round(get_peak_rss_mb(), 2)
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse the command line options of the benchmark.
+
+    Returns:
+        argparse.Namespace: the benchmark options.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the EssayScorer throughput.")
+    parser.add_argument("--batch-sizes", default="100,1000",
+                        help="comma separated numbers of essays scored per run")
+    parser.add_argument("--words", type=int, default=400, help="number of words per essay")
+    parser.add_argument("--stopword-ratio", type=float, default=0.4, help="proportion of stopwords")
+    parser.add_argument("--rare-ratio", type=float, default=0.1, help="proportion of rare corpus words")
+    parser.add_argument("--unknown-ratio", type=float, default=0.02, help="proportion of unknown words")
+    parser.add_argument("--seed", type=int, default=9136, help="seed of the essay generator")
+    parser.add_argument("--output", help="JSON file the results are written to")
+    parser.add_argument("--stages", action="store_true",
+                        help="also report the wall time of the tokenization and of each criterion")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    batch_sizes = [int(batch_size) for batch_size in args.batch_sizes.split(",")]
+    output_path = os.path.abspath(args.output) if args.output else None
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp_path:
+        os.chdir(tmp_path)
+        tp = TextProcessor(STOPWORDS_FILEPATH, CORPUS_FILEPATH, IDX2LABEL_FILEPATH, persist="never")
+        scorer = EssayScorer(tp, ScoringStats() if args.stages else None)
+        generator = EssayGenerator(tp, args.seed)
+
+        for batch_size in batch_sizes:
+            paths = []
+            for index in range(batch_size):
+                file_path = os.path.join(tmp_path, f"essay_{index}.txt")
+                with open(file_path, "w") as f:
+                    f.write(generator.generate(
+                        args.words, args.stopword_ratio, args.rare_ratio, args.unknown_ratio
+                    ))
+                paths.append(file_path)
+
+            result = {
+                "benchmark": "score_essay",
+                "batch_size": batch_size,
+                "words": args.words,
+                "stopword_ratio": args.stopword_ratio,
+                "rare_ratio": args.rare_ratio,
+                "unknown_ratio": args.unknown_ratio,
+                "seed": args.seed,
+                "python": platform.python_version(),
+                **bench_scoring(scorer, paths, PROB_STATEMENT)
+            }
+            if scorer.stats is not None:
+                result["stages"] = scorer.stats.summary()["stages"]
+                scorer.stats.reset()
+            results.append(result)
+            print(json.dumps(result))
+
+    if output_path:
+        with open(output_path, "w") as f:
+            json.dump(results, f, indent=2)
@@ -1,11 +1,949 @@
 import pandas as pd
+import atexit
+import hashlib
 import json
-from typing import Dict, List, Optional
+import math
+import mmap
+import os
+import struct
+import tempfile
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Mapping
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 # CONSTANTS - file paths to write
 WORD_FREQ_FILEPATH = "word_freq.txt"
 WORD2IDX_FILEPATH = "word2idx.txt"
 IDX2WORD_FILEPATH = "idx2word.txt"
+VOCAB_FILEPATH = "vocab.txt"
+VOCAB_BIN_FILEPATH = "vocab.bin"
+VOCAB_LOG_FILEPATH = "vocab.log"
+CORPUS_CACHE_DIRPATH = "corpus_cache"
+CORPUS_CACHE_MAX_ENTRIES = 4 # least recently used corpus word counts are removed past this number
+
+# CONSTANTS - vocabulary storage formats
+STORAGE_TEXT = "text"
+STORAGE_CONSOLIDATED = "consolidated"
+STORAGE_BINARY = "binary"
+STORAGES = (STORAGE_TEXT, STORAGE_CONSOLIDATED, STORAGE_BINARY)
+
+# CONSTANTS - vocabulary persistence policies
+PERSIST_EAGER = "eager"
+PERSIST_DEFERRED = "deferred"
+PERSIST_NEVER = "never"
+PERSIST_POLICIES = (PERSIST_EAGER, PERSIST_DEFERRED, PERSIST_NEVER)
+
+# CONSTANTS - parallel word counting (smaller files are counted in process, without starting a pool)
+PARALLEL_MIN_BYTES = 1 << 20
+PARALLEL_TASKS_PER_WORKER = 2 # chunks in flight per worker (bounds the memory of the joined chunk texts)
+
+# CONSTANTS - vocabulary snapshots (partitions of word_freq, words per block of the sorted words,
+# number of top / bottom words listed)
+SNAPSHOT_PARTITIONS = 256
+SNAPSHOT_BLOCK_SIZE = 512
+SNAPSHOT_LIST_SIZE = 100
+
+# CONSTANTS - tokenizer
+PUNCTUATIONS = "!\"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~"
+PUNCTUATION_TABLE = str.maketrans(PUNCTUATIONS, " " * len(PUNCTUATIONS))
+TOKENIZER_VERSION = "1" # bump whenever get_words splits text differently (invalidates the corpus cache)
+
+# ==================== TOKENIZER ====================
+def get_words(text: str) -> List[str]:
+    """
+    This function extract a list of (lowercase) cleaned words from the input text
+    based on the given requirements. The whole text is processed in bulk: punctuations
+    are mapped to blank spaces with a translate table, then split on whitespaces.
+
+    Args:
+        1. text (str): the input text string
+
+    Returns:
+        words (List[str]): a list of lowercase words
+
+    Requirements:
+        1. all words have been converted to lowercase
+        2. clean all the punctuations and contractions
+        3. filtering out numbers and words composed entirely of digits
+        4. discarding words with a length less than 2
+    """
+    cleaned_text = text.lower().translate(PUNCTUATION_TABLE)
+
+    # Most words are purely alphabetic -> only scan the rest for digits
+    return [
+        word for word in cleaned_text.split()
+        if len(word) >= 2 and (word.isalpha() or not check_word_has_number(word))
+    ]
+
+def check_word_has_number(word: str) -> bool:
+    """
+    This function check if a word contain a number (digit).
+
+    Args:
+        word (str): the word to be checked.
+
+    Returns:
+        bool: a boolean check if that function has a number or not.
+    """
+    for char in word:
+        if char.isdigit():
+            return True
+
+    return False
+
+# ==================== FILE HELPERS ====================
+def atomic_write(filepath: str, content: str | bytes) -> None:
+    """
+    This function writes a file atomically: the content is written to a temporary file
+    in the same folder, flushed to disk, then renamed over the file. Readers (and a crash
+    in the middle of the write) only ever see the complete old or new file.
+
+    Args:
+        1. filepath (str): the path of the file to write.
+        2. content (str | bytes): the whole content of the file.
+    """
+    folder = os.path.dirname(os.path.abspath(filepath))
+    fd, temp_filepath = tempfile.mkstemp(dir=folder, prefix=f".{os.path.basename(filepath)}.")
+
+    try:
+        with os.fdopen(fd, "wb" if isinstance(content, bytes) else "w") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.chmod(temp_filepath, 0o644)
+        os.replace(temp_filepath, filepath)
+    except BaseException:
+        os.unlink(temp_filepath)
+        raise
+
+def hash_file(filepath: str) -> str:
+    """
+    This function hashes the content of a file, reading it block by block.
+
+    Args:
+        1. filepath (str): the path of the file to hash.
+
+    Returns:
+        str: the hexadecimal sha1 of the file.
+    """
+    file_hash = hashlib.sha1()
+    with open(filepath, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            file_hash.update(block)
+
+    return file_hash.hexdigest()
+
+# Deferred TextProcessors with pending updates, held (strong references) until they are flushed
+_pending_flushes = set()
+
+
+def _flush_at_exit() -> None:
+    """
+    This function flushes the pending vocabulary updates of the deferred TextProcessors when the
+    interpreter exits (the instances are kept alive until then, so no update is dropped).
+    """
+    for text_processor in list(_pending_flushes):
+        text_processor.flush()
+
+
+atexit.register(_flush_at_exit)
+
+# ==================== STOPWORDS ====================
+class StopwordIndex:
+    """
+    Stopword Index Class - hash-set of stopwords, so that each membership check
+    costs one lookup instead of a scan over the whole stopword list.
+
+    Instance Variables:
+        1. words (frozenset): The set of (lowercase) stopwords.
+    """
+
+    def __init__(self, stopwords: Iterable[str]) -> None:
+        """
+        ========== StopwordIndex Constructor ==========
+
+        Initialise a new StopwordIndex instance.
+
+        Args:
+            1. stopwords (Iterable[str]): The stopwords (a list, a set or another index).
+        """
+        self.words = frozenset(stopwords)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.words
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.words)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+def count_words(
+        text: str,
+        stopwords: list[str] | StopwordIndex,
+        tokenizer: Callable[[str], List[str]] = get_words
+    ) -> Dict[str, int]:
+    """
+    This function splits the text into words and count number of time each word appears.
+    Exclude any word that is a stopword. Defined at module level so it can be sent to
+    worker processes (the tokenizer must then be a module-level function as well).
+
+    Args:
+        1. text (str): the unformatted text string.
+        2. stopwords (list[str] | StopwordIndex): Words to be filtered out.
+        3. tokenizer (Callable[[str], List[str]]): Function splitting the text into cleaned words.
+
+    Returns:
+        Dict[str, int]: A dictionary contain words and its amount.
+    """
+    if not text:
+        return {}
+
+    # Index the stopwords once instead of scanning the list for every word
+    if not isinstance(stopwords, (StopwordIndex, set, frozenset)):
+        stopwords = StopwordIndex(stopwords)
+
+    # process the text, extract the word list and generate a dictionary containing word count
+    words = tokenizer(text)
+    words_dict = {}
+
+    for word in words:
+        # Skip if word is a stopword
+        if word in stopwords:
+            continue
+
+        # add / update word into dictionary
+        if word not in words_dict:
+            words_dict[word] = 1
+        else:
+            words_dict[word] += 1
+
+    return words_dict
+
+# ==================== VOCABULARY INDEX ====================
+class FrequencyIndex:
+    """
+    Frequency Index Class - words bucketed by frequency, kept in the order of sorting
+    word_freq by descending frequency (words with the same frequency in word_freq order).
+    Updating one word only touches its old and new buckets.
+
+    Instance Variables:
+        1. buckets (dict): Dictionary of frequency -> sorted list of word sequence numbers.
+        2. freqs (list): Sorted list of the distinct frequencies.
+        3. word_seq (dict): Dictionary of word -> sequence number (its insertion order in word_freq).
+        4. seq_word (dict): Dictionary of sequence number -> word.
+        5. next_seq (int): Sequence number given to the next inserted word.
+    """
+
+    def __init__(self, word_freq: Dict[str, int]) -> None:
+        """
+        ========== FrequencyIndex Constructor ==========
+
+        Initialise a new FrequencyIndex instance from a word_freq dictionary.
+
+        Args:
+            1. word_freq (Dict[str, int]): a dictionary of words and its count (frequency)
+        """
+        self.buckets = {}
+        self.word_seq = {}
+        self.seq_word = {}
+
+        # Words are numbered in word_freq order -> each bucket is built already sorted
+        for seq, (word, freq) in enumerate(word_freq.items()):
+            self.buckets.setdefault(freq, []).append(seq)
+            self.word_seq[word] = seq
+            self.seq_word[seq] = word
+
+        self.freqs = sorted(self.buckets)
+        self.next_seq = len(self.word_seq)
+
+    def update(self, word: str, old_freq: int, new_freq: int) -> None:
+        """
+        This function moves a word from the bucket of its old frequency to the bucket of its new one.
+
+        Args:
+            1. word (str): the updated word.
+            2. old_freq (int): the frequency before the update (0 for a new word).
+            3. new_freq (int): the frequency after the update (0 for a removed word).
+        """
+        if old_freq == new_freq:
+            return None
+
+        if old_freq > 0:
+            seq = self.word_seq[word]
+            self._remove_from_bucket(old_freq, seq)
+        else:
+            seq = self.next_seq
+            self.next_seq += 1
+            self.word_seq[word] = seq
+            self.seq_word[seq] = word
+
+        if new_freq > 0:
+            if new_freq not in self.buckets:
+                self.buckets[new_freq] = []
+                insort(self.freqs, new_freq)
+            insort(self.buckets[new_freq], seq)
+        else:
+            del self.word_seq[word]
+            del self.seq_word[seq]
+
+    def iter_sorted(self) -> Iterator[Tuple[str, int]]:
+        """
+        This function iterates the words in descending order of frequency.
+
+        Returns:
+            Iterator[Tuple[str, int]]: the (word, frequency) tuples.
+        """
+        for freq in reversed(self.freqs):
+            for seq in self.buckets[freq]:
+                yield self.seq_word[seq], freq
+
+    def iter_sorted_reversed(self) -> Iterator[Tuple[str, int]]:
+        """
+        This function iterates the words in the reverse order of iter_sorted (ascending order of frequency).
+
+        Returns:
+            Iterator[Tuple[str, int]]: the (word, frequency) tuples.
+        """
+        for freq in self.freqs:
+            for seq in reversed(self.buckets[freq]):
+                yield self.seq_word[seq], freq
+
+    def get_top(self, k: int) -> List[Tuple[str, int]]:
+        """
+        This function gets the k most frequent words, visiting at most k words (and k buckets).
+
+        Args:
+            1. k (int): the number of words.
+
+        Returns:
+            List[Tuple[str, int]]: the first k (word, frequency) tuples of iter_sorted.
+        """
+        return list(islice(self.iter_sorted(), k))
+
+    def get_bottom(self, k: int) -> List[Tuple[str, int]]:
+        """
+        This function gets the k least frequent words, visiting at most k words (and k buckets).
+
+        Args:
+            1. k (int): the number of words.
+
+        Returns:
+            List[Tuple[str, int]]: the last k (word, frequency) tuples of iter_sorted, in the same order.
+        """
+        words = list(islice(self.iter_sorted_reversed(), k))
+        words.reverse()
+
+        return words
+
+    def _remove_from_bucket(self, freq: int, seq: int) -> None:
+        """
+        This function removes a word sequence number from a bucket, and the bucket once it is empty.
+
+        Args:
+            1. freq (int): the frequency of the bucket.
+            2. seq (int): the word sequence number.
+        """
+        bucket = self.buckets[freq]
+        del bucket[bisect_left(bucket, seq)]
+
+        if not bucket:
+            del self.buckets[freq]
+            del self.freqs[bisect_left(self.freqs, freq)]
+
+# ==================== VOCABULARY SNAPSHOTS ====================
+class PartitionedMap(Mapping):
+    """
+    Partitioned Map Class - immutable mapping split into SNAPSHOT_PARTITIONS dictionaries by key hash.
+    An update copies only the partitions of the changed keys, the others are shared with the previous map.
+
+    Instance Variables:
+        1. parts (Tuple[dict, ...]): The partitions (never modified once the map is built).
+        2. size (int): The number of keys.
+    """
+
+    def __init__(self, parts: Tuple[dict, ...], size: int) -> None:
+        """
+        ========== PartitionedMap Constructor ==========
+
+        Initialise a new PartitionedMap instance from its partitions.
+
+        Args:
+            1. parts (Tuple[dict, ...]): the partitions, each key in parts[hash(key) % len(parts)].
+            2. size (int): the number of keys.
+        """
+        self.parts = parts
+        self.size = size
+
+    @classmethod
+    def from_mapping(cls, mapping: Mapping, n_parts: Optional[int] = None) -> "PartitionedMap":
+        """
+        This function builds a PartitionedMap holding a copy of the mapping.
+
+        Args:
+            1. mapping (Mapping): the keys and their values.
+            2. n_parts (int): the number of partitions (default: SNAPSHOT_PARTITIONS).
+
+        Returns:
+            PartitionedMap: the map.
+        """
+        parts = tuple({} for _ in range(n_parts or SNAPSHOT_PARTITIONS))
+        for key, value in mapping.items():
+            parts[hash(key) % len(parts)][key] = value
+
+        return cls(parts, len(mapping))
+
+    def updated(self, changes: Dict) -> "PartitionedMap":
+        """
+        This function builds the map with the changes applied, sharing the unchanged partitions.
+
+        Args:
+            1. changes (Dict): the changed keys and their new values (None to remove the key).
+
+        Returns:
+            PartitionedMap: the updated map (this map is unchanged).
+        """
+        parts = list(self.parts)
+        copied = set()
+        size = self.size
+
+        for key, value in changes.items():
+            part_index = hash(key) % len(parts)
+            if part_index not in copied:
+                parts[part_index] = dict(parts[part_index])
+                copied.add(part_index)
+
+            part = parts[part_index]
+            if value is None:
+                size -= part.pop(key, None) is not None
+            else:
+                size += key not in part
+                part[key] = value
+
+        return PartitionedMap(tuple(parts), size)
+
+    def __getitem__(self, key):
+        return self.parts[hash(key) % len(self.parts)][key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.parts[hash(key) % len(self.parts)]
+
+    def __iter__(self) -> Iterator:
+        for part in self.parts:
+            yield from part
+
+    def __len__(self) -> int:
+        return self.size
+
+class SortedBlocks:
+    """
+    Sorted Blocks Class - immutable sorted sequence stored as tuples of about SNAPSHOT_BLOCK_SIZE items.
+    An update rebuilds only the blocks of the inserted / removed items, the others are shared with the
+    previous sequence.
+
+    Instance Variables:
+        1. blocks (Tuple[tuple, ...]): The sorted blocks (each block is a sorted tuple).
+        2. firsts (List): The first item of each block (to find the block of an item).
+        3. offsets (List[int]): The position of the first item of each block in the sequence.
+        4. size (int): The number of items.
+    """
+
+    def __init__(self, blocks: Tuple[tuple, ...]) -> None:
+        """
+        ========== SortedBlocks Constructor ==========
+
+        Initialise a new SortedBlocks instance from its (non-empty) blocks.
+
+        Args:
+            1. blocks (Tuple[tuple, ...]): the sorted blocks, in order.
+        """
+        self.blocks = blocks
+        self.firsts = [block[0] for block in blocks]
+        self.offsets = []
+
+        size = 0
+        for block in blocks:
+            self.offsets.append(size)
+            size += len(block)
+        self.size = size
+
+    @classmethod
+    def from_sorted(cls, items: Iterable) -> "SortedBlocks":
+        """
+        This function builds a SortedBlocks of already sorted items.
+
+        Args:
+            1. items (Iterable): the sorted items.
+
+        Returns:
+            SortedBlocks: the sequence.
+        """
+        items = list(items)
+        return cls(tuple(
+            tuple(items[start:start + SNAPSHOT_BLOCK_SIZE]) for start in range(0, len(items), SNAPSHOT_BLOCK_SIZE)
+        ))
+
+    def updated(self, added: Iterable, removed: Iterable) -> "SortedBlocks":
+        """
+        This function builds the sequence with items inserted and removed, sharing the unchanged blocks.
+        A block growing past twice SNAPSHOT_BLOCK_SIZE is split, and a block shrinking under half
+        SNAPSHOT_BLOCK_SIZE is merged into the previous one.
+
+        Args:
+            1. added (Iterable): the items to insert (not in the sequence).
+            2. removed (Iterable): the items to remove (in the sequence).
+
+        Returns:
+            SortedBlocks: the updated sequence (this sequence is unchanged).
+        """
+        if not self.blocks:
+            return SortedBlocks.from_sorted(sorted(added))
+
+        # Copy the blocks of the changed items only
+        changed_blocks = {}
+        for item, is_added in [(item, True) for item in added] + [(item, False) for item in removed]:
+            block_index = max(bisect_right(self.firsts, item) - 1, 0)
+            block = changed_blocks.get(block_index)
+            if block is None:
+                block = changed_blocks[block_index] = list(self.blocks[block_index])
+
+            if is_added:
+                insort(block, item)
+            else:
+                del block[bisect_left(block, item)]
+
+        blocks = []
+        for block_index, block in enumerate(self.blocks):
+            if block_index not in changed_blocks:
+                blocks.append(block)
+                continue
+
+            # Merge a changed block under half SNAPSHOT_BLOCK_SIZE into the previous block
+            block = changed_blocks[block_index]
+            if blocks and len(block) < SNAPSHOT_BLOCK_SIZE // 2:
+                block = list(blocks.pop()) + block
+
+            if len(block) > 2 * SNAPSHOT_BLOCK_SIZE:
+                n_blocks = len(block) // SNAPSHOT_BLOCK_SIZE
+                blocks.extend(
+                    tuple(block[part * len(block) // n_blocks:(part + 1) * len(block) // n_blocks])
+                    for part in range(n_blocks)
+                )
+            elif block:
+                blocks.append(tuple(block))
+
+        return SortedBlocks(tuple(blocks))
+
+    def index(self, item) -> Optional[int]:
+        """
+        This function finds the position of an item.
+
+        Args:
+            1. item: the item.
+
+        Returns:
+            int | None: the position of the item, None if it is not in the sequence.
+        """
+        block_index = bisect_right(self.firsts, item) - 1
+        if block_index < 0:
+            return None
+
+        block = self.blocks[block_index]
+        position = bisect_left(block, item)
+        if position == len(block) or block[position] != item:
+            return None
+
+        return self.offsets[block_index] + position
+
+    def __getitem__(self, position: int):
+        if not 0 <= position < self.size:
+            raise IndexError(position)
+
+        block_index = bisect_right(self.offsets, position) - 1
+        return self.blocks[block_index][position - self.offsets[block_index]]
+
+    def __iter__(self) -> Iterator:
+        for block in self.blocks:
+            yield from block
+
+    def __len__(self) -> int:
+        return self.size
+
+class SnapshotWord2Idx(Mapping):
+    """
+    Read-only word -> index mapping over the SortedBlocks of a snapshot (iterated in alphabetical order).
+    """
+    def __init__(self, words: SortedBlocks) -> None:
+        self.words = words
+
+    def __getitem__(self, word: str) -> int:
+        index = self.words.index(word)
+        if index is None:
+            raise KeyError(word)
+        return index
+
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and self.words.index(word) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.words)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+class SnapshotIdx2Word(Mapping):
+    """
+    Read-only index -> word mapping over the SortedBlocks of a snapshot (iterated in index order).
+    """
+    def __init__(self, words: SortedBlocks) -> None:
+        self.words = words
+
+    def __getitem__(self, index: int) -> str:
+        if not isinstance(index, int) or not 0 <= index < len(self.words):
+            raise KeyError(index)
+        return self.words[index]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(len(self.words)))
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+class VocabSnapshot:
+    """
+    Vocabulary Snapshot Class - immutable vocabulary at one version. It is published as a whole once an
+    update is complete, so a reader holding it never sees a half-updated vocabulary. A new version is
+    built from the delta of the update: the unchanged partitions of word_freq and blocks of the sorted
+    words are shared with the previous version.
+
+    Instance Variables:
+        1. version (int): The vocabulary version (number of changes since the instance was created).
+        2. word_freq (PartitionedMap): Read-only mapping of the words and their frequencies.
+        3. words (SortedBlocks): The words in alphabetical order.
+        4. word2idx (Mapping[str, int]): Read-only mapping of the words and their indexes.
+        5. idx2word (Mapping[int, str]): Read-only mapping of the indexes and their words.
+        6. top (Tuple[Tuple[str, int], ...]): The SNAPSHOT_LIST_SIZE most frequent (word, frequency) tuples.
+        7. bottom (Tuple[Tuple[str, int], ...]): The SNAPSHOT_LIST_SIZE least frequent (word, frequency) tuples.
+    """
+
+    def __init__(
+            self,
+            version: int,
+            word_freq: PartitionedMap,
+            words: SortedBlocks,
+            freq_index: FrequencyIndex
+        ) -> None:
+        """
+        ========== VocabSnapshot Constructor ==========
+
+        Initialise a new VocabSnapshot instance (see from_vocab and updated).
+
+        Args:
+            1. version (int): the vocabulary version.
+            2. word_freq (PartitionedMap): the words and their frequencies.
+            3. words (SortedBlocks): the words in alphabetical order.
+            4. freq_index (FrequencyIndex): the frequency index of the vocabulary (top / bottom words).
+        """
+        self.version = version
+        self.word_freq = word_freq
+        self.words = words
+        self.word2idx = SnapshotWord2Idx(words)
+        self.idx2word = SnapshotIdx2Word(words)
+        self.top = tuple(freq_index.get_top(SNAPSHOT_LIST_SIZE))
+        self.bottom = tuple(freq_index.get_bottom(SNAPSHOT_LIST_SIZE))
+
+    @classmethod
+    def from_vocab(cls, version: int, word_freq: Mapping, freq_index: FrequencyIndex) -> "VocabSnapshot":
+        """
+        This function builds the snapshot of a whole vocabulary (after a load or a replaced word_freq).
+
+        Args:
+            1. version (int): the vocabulary version.
+            2. word_freq (Mapping): the words and their frequencies.
+            3. freq_index (FrequencyIndex): the frequency index of the vocabulary.
+
+        Returns:
+            VocabSnapshot: the snapshot.
+        """
+        return cls(version, PartitionedMap.from_mapping(word_freq), SortedBlocks.from_sorted(sorted(word_freq)),
+                   freq_index)
+
+    def updated(self, version: int, word_changes: Dict[str, int], freq_index: FrequencyIndex) -> "VocabSnapshot":
+        """
+        This function builds the snapshot of the next version from the words changed by the updates.
+
+        Args:
+            1. version (int): the new vocabulary version.
+            2. word_changes (Dict[str, int]): the changed words and their new frequencies (0 if removed).
+            3. freq_index (FrequencyIndex): the frequency index of the updated vocabulary.
+
+        Returns:
+            VocabSnapshot: the new snapshot (this snapshot is unchanged).
+        """
+        added = [word for word, freq in word_changes.items() if freq > 0 and word not in self.word_freq]
+        removed = [word for word, freq in word_changes.items() if freq == 0 and word in self.word_freq]
+
+        word_freq = self.word_freq.updated({word: freq or None for word, freq in word_changes.items()})
+        words = self.words.updated(added, removed) if added or removed else self.words
+
+        return VocabSnapshot(version, word_freq, words, freq_index)
+
+    def get_top_words(self, k: int) -> List[Tuple[str, int]]:
+        """
+        This function gets the k most frequent words of the snapshot.
+
+        Args:
+            1. k (int): the number of words (at most SNAPSHOT_LIST_SIZE).
+
+        Returns:
+            List[Tuple[str, int]]: the (word, frequency) tuples.
+        """
+        self._check_list_size(k)
+        return list(self.top[:k])
+
+    def get_bottom_words(self, k: int) -> List[Tuple[str, int]]:
+        """
+        This function gets the k least frequent words of the snapshot.
+
+        Args:
+            1. k (int): the number of words (at most SNAPSHOT_LIST_SIZE).
+
+        Returns:
+            List[Tuple[str, int]]: the (word, frequency) tuples, in descending order of frequency.
+        """
+        self._check_list_size(k)
+        return list(self.bottom[-k:]) if k > 0 else []
+
+    def _check_list_size(self, k: int) -> None:
+        """
+        This function checks a number of listed words is held by the snapshot.
+
+        Args:
+            1. k (int): the number of words.
+        """
+        if k > SNAPSHOT_LIST_SIZE:
+            raise ValueError(f"A snapshot lists at most {SNAPSHOT_LIST_SIZE} words, got {k}")
+
+# ==================== BINARY VOCABULARY STORE ====================
+class BinaryVocab:
+    """
+    Binary Vocabulary Class - read-only vocabulary memory-mapped from a binary file,
+    words / indexes / frequencies are resolved on access without building dictionaries.
+
+    File layout (little-endian):
+        1. header: magic b"VOCB", version (uint16), number of words (uint64), string table size (uint64)
+        2. offsets: (number of words + 1) uint64, start of each word in the string table
+        3. counts: number of words uint64, frequency of each word
+        4. freq_order: number of words uint64, word indexes in descending order of frequency
+        5. string table: the utf-8 encoded words, in alphabetical order (word index = position)
+
+    Instance Variables:
+        1. filepath (str): Path of the binary vocabulary file.
+        2. size (int): Number of words in the vocabulary.
+    """
+    MAGIC = b"VOCB"
+    VERSION = 1
+    HEADER = struct.Struct("<4sHQQ")
+    UINT64 = struct.Struct("<Q")
+
+    def __init__(self, filepath: str) -> None:
+        """
+        ========== BinaryVocab Constructor ==========
+
+        Memory-map a binary vocabulary file and check its header.
+
+        Args:
+            1. filepath (str): Path of the binary vocabulary file.
+        """
+        self.filepath = filepath
+        with open(filepath, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.size, strings_size = self.HEADER.unpack_from(self._mmap, 0)
+        if magic != self.MAGIC:
+            raise ValueError(f"{filepath} is not a binary vocabulary file")
+        if version != self.VERSION:
+            raise ValueError(f"{filepath} has an unsupported binary vocabulary version: {version}")
+
+        # Start of each section in the file
+        self._offsets_start = self.HEADER.size
+        self._counts_start = self._offsets_start + (self.size + 1) * self.UINT64.size
+        self._freq_order_start = self._counts_start + self.size * self.UINT64.size
+        self._strings_start = self._freq_order_start + self.size * self.UINT64.size
+
+    def __len__(self) -> int:
+        return self.size
+
+    def get_word(self, index: int) -> str:
+        """
+        Get the word at an index.
+
+        Args:
+            1. index (int): the word index.
+
+        Returns:
+            str: the word.
+        """
+        if not 0 <= index < self.size:
+            raise KeyError(index)
+
+        return self._get_word_bytes(index).decode("utf-8")
+
+    def get_index(self, word: str) -> Optional[int]:
+        """
+        Get the index of a word, by binary search over the (alphabetical) string table.
+
+        Args:
+            1. word (str): the word.
+
+        Returns:
+            int | None: the word index, None if the word is not in the vocabulary.
+        """
+        word_bytes = word.encode("utf-8")
+
+        low, high = 0, self.size
+        while low < high:
+            middle = (low + high) // 2
+            if self._get_word_bytes(middle) < word_bytes:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low < self.size and self._get_word_bytes(low) == word_bytes:
+            return low
+        return None
+
+    def get_freq(self, index: int) -> int:
+        """
+        Get the frequency of the word at an index.
+
+        Args:
+            1. index (int): the word index.
+
+        Returns:
+            int: the word frequency.
+        """
+        return self._read_uint64(self._counts_start, index)
+
+    def iter_freq_order(self) -> Iterator[int]:
+        """
+        Iterate the word indexes in descending order of frequency.
+
+        Returns:
+            Iterator[int]: the word indexes.
+        """
+        for position in range(self.size):
+            yield self._read_uint64(self._freq_order_start, position)
+
+    def _get_word_bytes(self, index: int) -> bytes:
+        start = self._read_uint64(self._offsets_start, index)
+        end = self._read_uint64(self._offsets_start, index + 1)
+        return self._mmap[self._strings_start + start:self._strings_start + end]
+
+    def _read_uint64(self, section_start: int, position: int) -> int:
+        return self.UINT64.unpack_from(self._mmap, section_start + position * self.UINT64.size)[0]
+
+    @classmethod
+    def write(
+            cls,
+            filepath: str,
+            sorted_words: List[str],
+            word_freq: Dict[str, int],
+            word_sorted_by_freq: Iterable[Tuple[str, int]]
+        ) -> None:
+        """
+        Write a vocabulary to a binary vocabulary file. The file is written atomically,
+        so the memory-mapped file of a previous load is never truncated.
+
+        Args:
+            1. filepath (str): Path of the binary vocabulary file.
+            2. sorted_words (List[str]): the words in alphabetical order.
+            3. word_freq (Dict[str, int]): a dictionary of words and its count (frequency).
+            4. word_sorted_by_freq (Iterable[Tuple[str, int]]): (word, frequency) in descending order of frequency.
+        """
+        encoded_words = [word.encode("utf-8") for word in sorted_words]
+        word2idx = {word: index for index, word in enumerate(sorted_words)}
+
+        offsets = [0]
+        for word_bytes in encoded_words:
+            offsets.append(offsets[-1] + len(word_bytes))
+
+        size = len(sorted_words)
+        counts = [word_freq[word] for word in sorted_words]
+        freq_order = [word2idx[word] for word, _ in word_sorted_by_freq]
+
+        atomic_write(filepath, b"".join((
+            cls.HEADER.pack(cls.MAGIC, cls.VERSION, size, offsets[-1]),
+            struct.pack(f"<{size + 1}Q", *offsets),
+            struct.pack(f"<{size}Q", *counts),
+            struct.pack(f"<{size}Q", *freq_order),
+            *encoded_words
+        )))
+
+class MappedWordFreq(Mapping):
+    """
+    Read-only word -> frequency mapping over a BinaryVocab (iterated in descending order of frequency).
+    """
+    def __init__(self, vocab: BinaryVocab) -> None:
+        self.vocab = vocab
+
+    def __getitem__(self, word: str) -> int:
+        index = self.vocab.get_index(word)
+        if index is None:
+            raise KeyError(word)
+        return self.vocab.get_freq(index)
+
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and self.vocab.get_index(word) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return (self.vocab.get_word(index) for index in self.vocab.iter_freq_order())
+
+    def __len__(self) -> int:
+        return len(self.vocab)
+
+class MappedWord2Idx(Mapping):
+    """
+    Read-only word -> index mapping over a BinaryVocab (iterated in alphabetical order).
+    """
+    def __init__(self, vocab: BinaryVocab) -> None:
+        self.vocab = vocab
+
+    def __getitem__(self, word: str) -> int:
+        index = self.vocab.get_index(word)
+        if index is None:
+            raise KeyError(word)
+        return index
+
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and self.vocab.get_index(word) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return (self.vocab.get_word(index) for index in range(len(self.vocab)))
+
+    def __len__(self) -> int:
+        return len(self.vocab)
+
+class MappedIdx2Word(Mapping):
+    """
+    Read-only index -> word mapping over a BinaryVocab (iterated in index order).
+    """
+    def __init__(self, vocab: BinaryVocab) -> None:
+        self.vocab = vocab
+
+    def __getitem__(self, index: int) -> str:
+        return self.vocab.get_word(index)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(len(self.vocab)))
+
+    def __len__(self) -> int:
+        return len(self.vocab)
 
 class TextProcessor:
     """
@@ -19,13 +957,39 @@ class TextProcessor:
         5. idx2label (pandas.DataFrame): DataFrame mapping label ids to label names.
         6. corpus (pandas.DataFrame): DataFrame of all the text data, 
         containing 4 columns: id, text, label, label_name
+        (read again from corpus_filepath on each access with lazy_corpus)
+        7. tokenizer (Callable[[str], List[str]]): Function splitting a text into cleaned words.
+        8. chunk_rows (int | None): Number of corpus rows read and counted at a time
+        (None: the whole corpus at once).
+        9. workers (int): Number of processes counting the corpus words.
+        10. stopword_index (StopwordIndex): Hash-set index of the stopwords.
+        11. storage (str): Format of the saved vocabulary: "text", "consolidated" or "binary".
+        12. journal (bool): Whether updates are appended to a delta log instead of saving the vocabulary.
+        13. compact_threshold (int): Number of delta records in the log before it is compacted.
+        14. corpus_filepath (str): Path of the corpus file.
+        15. lazy_corpus (bool): Whether the corpus is loaded on demand instead of kept in memory.
+        16. vocab_listeners (list): Indexes derived from word_freq, kept in sync with each update.
+        17. corpus_cache (bool): Whether the corpus word counts are cached across instances.
+        18. persist (str): When the vocabulary is written: "eager", "deferred" or "never".
+        19. snapshots (bool): Whether an immutable VocabSnapshot is published after each update.
+        20. vocab_version (int): Number of changes of the vocabulary since the instance was created.
     """
 
     def __init__(
             self,
             stopwords_filepath: str,
             corpus_filepath: str,
-            idx2label_filepath: str
+            idx2label_filepath: str,
+            tokenizer: Optional[Callable[[str], List[str]]] = None,
+            chunk_rows: Optional[int] = None,
+            workers: int = 1,
+            storage: str = STORAGE_TEXT,
+            journal: bool = False,
+            compact_threshold: int = 100000,
+            lazy_corpus: bool = False,
+            corpus_cache: bool = False,
+            persist: str = PERSIST_EAGER,
+            snapshots: bool = False
         ) -> None:
         # YOUR CODES START HERE
         """
@@ -37,23 +1001,126 @@ class TextProcessor:
             1. stopwords_filepath: Path of the stop words file.
             2. corpus_filepath: Path of the corpus file.
             3. idx2label_filepath: Path of the idx2label file.
+            4. tokenizer: Function splitting a text into cleaned words (default: get_words).
+            5. chunk_rows: Number of corpus rows read and counted at a time, bounding the memory
+            used by the ingestion of large corpora (default: None, the whole corpus at once).
+            6. workers: Number of processes the corpus texts are sharded across when counting
+            words, one pool per corpus file of at least PARALLEL_MIN_BYTES (default: 1, count in the current process).
+            7. storage: Format of the saved vocabulary: "text" for word_freq.txt / word2idx.txt /
+            idx2word.txt, "consolidated" for a single vocab.txt holding the index and the frequency
+            of each word, or "binary" for a single memory-mapped vocab.bin (default: "text").
+            8. journal: Whether add_file / delete_file append the (word, signed count) delta to the log
+            vocab.log instead of saving the whole vocabulary (default: False).
+            9. compact_threshold: Number of delta records in the log before it is folded into the
+            saved vocabulary (default: 100000).
+            10. lazy_corpus: Whether the corpus is only streamed to count the words and loaded again
+            on demand when corpus is accessed, instead of kept in memory (default: False).
+            11. corpus_cache: Whether the word counts of the corpus are saved in the corpus_cache folder,
+            keyed by the hash of the corpus, stopwords and idx2label files and the tokenizer version, so that
+            the next instance built from the same files loads them instead of tokenizing the corpus again.
+            Only the CORPUS_CACHE_MAX_ENTRIES most recently used entries are kept
+            (default: False, only used with the default tokenizer).
+            12. persist: When the vocabulary is written: "eager" saves it on construction and after each
+            add_file / delete_file, "deferred" only keeps it in memory until flush() or the interpreter exits,
+            and "never" until flush() (default: "eager").
+            13. snapshots: Whether a VocabSnapshot (immutable version of the vocabulary, built from the delta
+            of the updates) is published once the construction, each add_file / delete_file, load and save
+            is complete, for readers running concurrently with the updates (see get_snapshot) (default: False).
             
         Returns:
             None
         """
         # Initialise instance variables
+        self.tokenizer = tokenizer if tokenizer is not None else get_words
+        self.chunk_rows = chunk_rows
+        self.workers = workers
+        self.storage = self._check_storage(storage)
+        self.persist = self._check_persist(persist)
+        self.snapshots = snapshots
+        self.vocab_version = 0
+        self._snapshot = None
+        # Previous snapshot, released by the writer on the next publish (not by the last reader dropping it)
+        self._previous_snapshot = None
+        # Words changed since the last snapshot and their new freq (None: the vocabulary was replaced)
+        self._snapshot_changes = None
+        self.journal = journal
+        self.compact_threshold = compact_threshold
         self.word_freq = {}
         self.word2idx = {}
         self.idx2word = {}
+
+        # Vocabulary indexes updated from the delta of each add / delete (None: to rebuild)
+        self._sorted_words = None
+        self._freq_index = None
+        self._added_words = set()
+        self._removed_words = set()
+
+        # Memory-mapped vocabulary behind read-only word_freq / word2idx / idx2word after a binary load
+        self._binary_vocab = None
+
+        # Delta of the current update, and number of delta records in the log (journal only)
+        self._journal_delta = {}
+        self._journal_records = 0
+
+        # Whether the vocabulary has updates not written yet, and whether they need a whole save
+        # (not only a delta appended to the log)
+        self._dirty = False
+        self._needs_save = False
+
+        # Indexes derived from word_freq (see add_vocab_listener)
+        self.vocab_listeners = []
+
         self.stopwords = self.extract_stopwords(stopwords_filepath)
+        self.stopword_index = StopwordIndex(self.stopwords)
         self.idx2label = self._load_idx2label(idx2label_filepath)
-        self.corpus = self._get_corpus(corpus_filepath, self.idx2label)
-        
+        self._label_names = self._get_label_names(self.idx2label)
+        self.corpus_filepath = corpus_filepath
+        self.lazy_corpus = lazy_corpus
+        self.corpus_cache = corpus_cache and self.tokenizer is get_words
+
+        # Word counts of the same corpus saved by a previous instance (None: not cached)
+        cache_filepath = None
+        cached_word_freq = None
+        if self.corpus_cache:
+            cache_filepath = self._get_corpus_cache_filepath(
+                stopwords_filepath, corpus_filepath, idx2label_filepath
+            )
+            if os.path.isfile(cache_filepath):
+                cached_word_freq = self._load_word_freq(cache_filepath)
+                # Mark the entry as recently used
+                os.utime(cache_filepath)
+
         # Update word_freq from the extracted corpus texts
-        self._add_freq_to_wordfreq(self.corpus["text"])
+        if lazy_corpus:
+            self._corpus = None
+        else:
+            self.corpus = self._get_corpus(corpus_filepath, self.idx2label)
+
+        if cached_word_freq is not None:
+            self.set_word_freq(cached_word_freq)
+        else:
+            # One process pool (if any) counts the whole corpus
+            with self._get_counting_pool(corpus_filepath) as pool:
+                if lazy_corpus:
+                    # Stream the corpus chunk by chunk, only the word counts are kept
+                    for corpus_chunk in self._iter_corpus(corpus_filepath, self.idx2label, text_only=True):
+                        self._add_freq_to_wordfreq(corpus_chunk["text"], pool)
+                else:
+                    self._add_freq_to_wordfreq(self.corpus["text"], pool)
+
+        if cache_filepath is not None and cached_word_freq is None:
+            os.makedirs(CORPUS_CACHE_DIRPATH, exist_ok=True)
+            atomic_write(cache_filepath, "".join(f"{word} {freq}\n" for word, freq in self.word_freq.items()))
+            self._prune_corpus_cache(cache_filepath)
         
-        # Save the extracted word_freq to 3 text files
-        self.save()
+        # Save the extracted word_freq to 3 text files, or only build the indexes until flush()
+        if self.persist == PERSIST_EAGER:
+            self.save()
+        else:
+            self._update_word_idx_dicts()
+            self._mark_dirty(needs_save=True)
+
+        self._publish_snapshot()
     
     # ========== ADD FILE FUNCTION WITH PRIVATE HELPER ==========
     def add_file(self, add_file_path: str) -> None:
@@ -68,98 +1135,479 @@ class TextProcessor:
         Returns:
             This function does not return anything. It saves the vocabulary and word frequency by save method.
         """
-        # Extract the corpus text to add / update from the text file
-        added_corpus = self._get_corpus(corpus_filepath=add_file_path, label_df=self.idx2label)
-        corpus_texts = added_corpus["text"]
+        # Count the whole file first, so a file failing to be read leaves the vocabulary unchanged
+        added_word_freq = self._count_file_words(add_file_path)
+        if added_word_freq:
+            self._apply_word_delta(added_word_freq)
         
-        # Add word / Update word frequencies and overwrite files
-        self._add_freq_to_wordfreq(corpus_texts)
-        self.save()
+        # Overwrite files (or append to the log) with the updated word frequencies
+        self._persist_update()
         
 
-    def _add_freq_to_wordfreq(self, corpus_texts: List[str] | pd.Series) -> None:
+    def _add_freq_to_wordfreq(
+            self,
+            corpus_texts: List[str] | pd.Series,
+            pool: Optional[ProcessPoolExecutor] = None
+        ) -> None:
+        """
+        This function update the word frequency of TextProcessor when initiating instance or adding file.
+        Args:
+            texts (List[str] | pd.Series): A list or pandas Series of text documents to be processed.
+            pool (ProcessPoolExecutor | None): The process pool counting the words (None: in process).
+
+        Returns:
+            This function return nothing. It is used for updating word frequency.
+        """
+        added_word_freq = self._count_corpus_words(corpus_texts, pool)
+        
+        if not added_word_freq:
+            return None
+
+        # Insert new word / increment freq value for existing words in word_freq dictionary
+        self._apply_word_delta(added_word_freq)
+    
+    # ========== DELETE FILE FUNCTION WITH PRIVATE HELPER ==========
+    def delete_file(self, delete_file_path) -> None:
+        # YOUR CODES START HERE
+        """
+        Delete the words frequency from a delete file and save the vocabulary and word frequency.
+        
+        Args:
+            delete_file_path: The path of the file containing the deleted words.
+
+        Returns:
+            This function does not return anything. It saves the vocabulary and word frequency by save method.
+        """
+        if delete_file_path is None:
+            return None
+        
+        # Count the whole file first, so a file failing to be read leaves the vocabulary unchanged
+        deleted_word_freq = self._count_file_words(delete_file_path)
+        if deleted_word_freq:
+            # Decrease freq value for each word into the word_freq dictionary
+            self._apply_word_delta({word: -freq for word, freq in deleted_word_freq.items()})
+
+        # Overwrite files (or append to the log) with the updated word frequencies
+        self._persist_update()
+
+    def _count_file_words(self, file_path: str) -> Dict[str, int]:
+        """
+        This function counts the words of an added / deleted corpus file, streamed chunk by chunk.
+
+        Args:
+            file_path (str): The path of the corpus file.
+
+        Returns:
+            Dict[str, int]: Dictionary of the words of the file and their counts.
+        """
+        word_freq = {}
+        with self._get_counting_pool(file_path) as pool:
+            for corpus_chunk in self._iter_corpus(file_path, self.idx2label, text_only=True):
+                for word, freq in self._count_corpus_words(corpus_chunk["text"], pool).items():
+                    word_freq[word] = word_freq.get(word, 0) + freq
+
+        return word_freq
+
+    def _get_counting_pool(self, file_path: str) -> ProcessPoolExecutor | nullcontext:
+        """
+        This function starts the process pool counting the words of a corpus file, shared by all its chunks.
+        No pool is started with a single worker or for a file under PARALLEL_MIN_BYTES (counted in process).
+
+        Args:
+            file_path (str): The path of the corpus file.
+
+        Returns:
+            ProcessPoolExecutor | nullcontext: A context manager giving the pool, or None.
+        """
+        if self.workers > 1 and os.path.getsize(file_path) >= PARALLEL_MIN_BYTES:
+            return ProcessPoolExecutor(max_workers=self.workers)
+
+        return nullcontext()
+
+    def _apply_word_delta(self, word_delta: Dict[str, int]) -> None:
+        """
+        This function applies signed word counts to word_freq and records the changed words,
+        so that the vocabulary indexes only need to update the delta.
+        
+        Args:
+            word_delta (Dict[str, int]): Dictionary of words and their signed counts:
+            positive counts insert / increment words, negative counts decrement existing words
+            (removed from word_freq once their freq drop to 0 or below).
+
+        Returns:
+            This function return nothing. It is used for updating word frequency.
+        """
+        self._materialise_vocab()
+        self.vocab_version += 1
+
+        for word, delta in word_delta.items():
+            old_freq = self.word_freq.get(word, 0)
+
+            # Skip deleting a word not in the vocabulary
+            if delta == 0 or (delta < 0 and old_freq == 0):
+                continue
+
+            new_freq = max(old_freq + delta, 0)
+            if new_freq > 0:
+                self.word_freq[word] = new_freq
+            else:
+                self.word_freq.pop(word, None)
+
+            # Record the words inserted / removed since the last index update
+            if old_freq == 0:
+                if word in self._removed_words:
+                    self._removed_words.discard(word)
+                else:
+                    self._added_words.add(word)
+            elif new_freq == 0:
+                if word in self._added_words:
+                    self._added_words.discard(word)
+                else:
+                    self._removed_words.add(word)
+
+            if self._freq_index is not None:
+                self._freq_index.update(word, old_freq, new_freq)
+
+            for listener in self.vocab_listeners:
+                listener.update(word, old_freq, new_freq)
+
+            # Record the change for the next snapshot
+            if self._snapshot_changes is not None:
+                self._snapshot_changes[word] = new_freq
+
+            # Merge the effective change (not the requested delta, clamped at 0) of the updates not
+            # logged yet, so that replaying one merged record gives the same freq as applying them in order
+            if self.journal:
+                journal_delta = self._journal_delta.get(word, 0) + new_freq - old_freq
+                if journal_delta != 0:
+                    self._journal_delta[word] = journal_delta
+                else:
+                    self._journal_delta.pop(word, None)
+
+    # ========== VOCABULARY LISTENER FUNCTIONS WITH PRIVATE HELPER ==========
+    def add_vocab_listener(self, listener) -> None:
+        """
+        This function registers an index derived from word_freq, so that it is updated
+        word by word by add_file / delete_file instead of being rebuilt by its owner.
+
+        Args:
+            listener: An object with an update(word, old_freq, new_freq) method, called for each
+            changed word (a freq of 0 means not in the vocabulary), and a reset(word_freq) method,
+            called with the whole vocabulary on registration, load and set_word_freq.
+
+        Returns:
+            None
+        """
+        self.vocab_listeners.append(listener)
+        listener.reset(self.word_freq)
+
+    def remove_vocab_listener(self, listener) -> None:
+        """
+        This function unregisters an index added by add_vocab_listener.
+
+        Args:
+            listener: The registered index.
+
+        Returns:
+            None
+        """
+        self.vocab_listeners.remove(listener)
+
+    def _reset_vocab_listeners(self) -> None:
+        """
+        This function rebuilds the registered indexes after word_freq is replaced as a whole.
+        """
+        for listener in self.vocab_listeners:
+            listener.reset(self.word_freq)
+
+    # ========== DELTA LOG FUNCTIONS WITH PRIVATE HELPERS ==========
+    def compact(self) -> None:
+        """
+        Fold the delta log into the saved vocabulary: save the whole vocabulary
+        and start a new, empty log on top of it.
+
+        Returns:
+            This function does not return anything.
+        """
+        self.save()
+
+    def flush(self) -> None:
+        """
+        Write the updates of the vocabulary not written yet (with the "deferred" and "never" persistence):
+        the whole vocabulary is saved, or with the journal, the merged delta of the updates is appended to the log.
+        Nothing is written if the vocabulary has no pending update.
+
+        Returns:
+            This function does not return anything.
+        """
+        if not self._dirty:
+            return None
+
+        if self._needs_save:
+            self.save()
+        else:
+            self._write_update()
+
+        self._dirty = False
+        _pending_flushes.discard(self)
+
+    def _mark_dirty(self, needs_save: bool = False) -> None:
+        """
+        This function marks the vocabulary as having updates not written yet. A deferred instance is
+        held until it is flushed, so its updates are still written at exit if it is dropped before.
+
+        Args:
+            needs_save (bool): Whether the whole vocabulary must be saved (not only the logged delta).
+        """
+        self._dirty = True
+        self._needs_save = self._needs_save or needs_save
+
+        if self.persist == PERSIST_DEFERRED:
+            _pending_flushes.add(self)
+
+    def _persist_update(self) -> None:
+        """
+        This function persists an update of the vocabulary (see _write_update). Without the "eager"
+        persistence, only the vocabulary indexes are updated and the update is written on flush().
+
+        Returns:
+            This function does not return anything.
+        """
+        if self.persist != PERSIST_EAGER:
+            self._update_word_idx_dicts()
+            self._mark_dirty()
+        else:
+            self._write_update()
+
+        self._publish_snapshot()
+
+    def _write_update(self) -> None:
+        """
+        This function writes an update of the vocabulary: it saves the whole vocabulary, or with the
+        journal, appends the delta of the update to the log (compacted once it reaches compact_threshold
+        records) and only updates the vocabulary indexes in memory.
+
+        Returns:
+            This function does not return anything.
+        """
+        if not self.journal:
+            self.save()
+            return None
+
+        self._append_journal(self._journal_delta)
+        self._journal_delta = {}
+        self._update_word_idx_dicts()
+
+        if self._journal_records >= self.compact_threshold:
+            self.compact()
+
+    def _append_journal(self, word_delta: Dict[str, int]) -> None:
+        """
+        This function appends the delta of one update to the log: one "word count" line for each word
+        and a blank line marking the update as complete, flushed to disk before returning.
+
+        Args:
+            word_delta (Dict[str, int]): Dictionary of words and their signed counts.
+        """
+        if not word_delta:
+            return None
+
+        with open(VOCAB_LOG_FILEPATH, "a") as f:
+            f.write("".join(f"{word} {delta}\n" for word, delta in word_delta.items()) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+        self._journal_records += len(word_delta)
+
+    def _reset_journal(self, storage: str) -> None:
+        """
+        This function starts a new, empty log on top of the saved vocabulary. The log header holds
+        the hash of the saved vocabulary, so a log which was already folded into it is never replayed.
+
+        Args:
+            storage (str): the format of the saved vocabulary.
+        """
+        atomic_write(VOCAB_LOG_FILEPATH, f"base {self._hash_snapshot(storage)}\n")
+        self._journal_records = 0
+        self._journal_delta = {}
+
+    def _replay_journal(self, storage: str) -> None:
+        """
+        This function replays the complete updates of the log on top of the loaded vocabulary.
+        The log is restarted if it does not start from the loaded vocabulary (already compacted).
+        Malformed lines are skipped, and an incomplete last update (crash while appending) is ignored
+        and cut from the log, so the next update is not appended to it.
+
+        Args:
+            storage (str): the format of the loaded vocabulary.
+        """
+        self._journal_records = 0
+        self._journal_delta = {}
+        base_hash = self._hash_snapshot(storage)
+
+        if not os.path.isfile(VOCAB_LOG_FILEPATH):
+            self._reset_journal(storage)
+            return None
+
+        # Read in binary mode, to track the byte offset where the last complete update ends
+        with open(VOCAB_LOG_FILEPATH, "rb") as f:
+            header = f.readline()
+            if header.decode("utf-8", errors="replace").split() != ["base", base_hash]:
+                self._reset_journal(storage)
+                return None
+
+            complete_size = len(header) if header.endswith(b"\n") else 0
+            offset = complete_size
+            word_delta = {}
+            for line in f:
+                offset += len(line)
+
+                # A blank line marks the end of an update
+                if line == b"\n":
+                    self._apply_word_delta(word_delta)
+                    self._journal_records += len(word_delta)
+                    word_delta = {}
+                    complete_size = offset
+                    continue
+
+                record = line.decode("utf-8", errors="replace").split()
+                if not line.endswith(b"\n") or len(record) != 2 or not record[1].lstrip("-").isdigit():
+                    continue
+                word_delta[record[0]] = word_delta.get(record[0], 0) + int(record[1])
+
+        # Cut the incomplete last update (or a torn header) before anything is appended
+        if complete_size == 0:
+            self._reset_journal(storage)
+        elif offset > complete_size:
+            os.truncate(VOCAB_LOG_FILEPATH, complete_size)
+
+        self._journal_delta = {}
+
+        # Without any replayed update, a binary vocabulary is still memory-mapped (its indexes are up to date)
+        if self._binary_vocab is None:
+            self._update_word_idx_dicts()
+
+    def _hash_snapshot(self, storage: str) -> str:
         """
-        This function update the word frequency of TextProcessor when initiating instance or adding file.
+        This function hashes the saved vocabulary file holding the word frequencies.
+
         Args:
-            texts (List[str] | pd.Series): A list or pandas Series of text documents to be processed.
+            storage (str): the format of the saved vocabulary.
 
         Returns:
-            This function return nothing. It is used for updating word frequency.
+            str: the hexadecimal sha1 of the file.
         """
-        # Concatenate all the text from the corpus text
-        added_text = ' '.join(corpus_texts)
-        added_word_freq = self.extract_word_freq(text=added_text, stopwords=self.stopwords)
-        
-        if not added_word_freq:
-            return None
+        filepath = {
+            STORAGE_TEXT: WORD_FREQ_FILEPATH,
+            STORAGE_CONSOLIDATED: VOCAB_FILEPATH,
+            STORAGE_BINARY: VOCAB_BIN_FILEPATH
+        }[storage]
 
-        # Insert new word / increment freq value for existing words in word_freq dictionary
-        for word, freq in added_word_freq.items():
-            self.word_freq[word] = self.word_freq.get(word, 0) + freq
-    
-    # ========== DELETE FILE FUNCTION WITH PRIVATE HELPER ==========
-    def delete_file(self, delete_file_path) -> None:
-        # YOUR CODES START HERE
+        return hash_file(filepath)
+
+    def _get_corpus_cache_filepath(
+            self,
+            stopwords_filepath: str,
+            corpus_filepath: str,
+            idx2label_filepath: str
+        ) -> str:
         """
-        Delete the words frequency from a delete file and save the vocabulary and word frequency.
-        
+        This function gets the path of the cached word counts of a corpus, named after the hash of
+        the files they are counted from and of the tokenizer version.
+
         Args:
-            delete_file_path: The path of the file containing the deleted words.
+            1. stopwords_filepath (str): Path of the stop words file.
+            2. corpus_filepath (str): Path of the corpus file.
+            3. idx2label_filepath (str): Path of the idx2label file (rows with unknown labels are dropped).
 
         Returns:
-            This function does not return anything. It saves the vocabulary and word frequency by save method.
+            str: the path of the cache file (in the corpus_cache folder).
         """
-        if delete_file_path is None:
-            return None
-        
-        deleted_corpus = self._get_corpus(corpus_filepath=delete_file_path, label_df=self.idx2label)
-        deleted_texts = deleted_corpus["text"]
+        cache_key = hashlib.sha1(" ".join([
+            hash_file(corpus_filepath),
+            hash_file(stopwords_filepath),
+            hash_file(idx2label_filepath),
+            TOKENIZER_VERSION
+        ]).encode()).hexdigest()
 
-        # Delete word / update word frequencies and overwrite files
-        self._delete_freq_from_wordfreq(deleted_texts)
-        self.save()
-        
-    def _delete_freq_from_wordfreq(self, corpus_texts: List[str] | pd.Series) -> None:
+        return os.path.join(CORPUS_CACHE_DIRPATH, f"{cache_key}.txt")
+
+    def _prune_corpus_cache(self, cache_filepath: str) -> None:
         """
-        This function update the word frequency of TextProcessor when deleting file.
-        
-        Args:
-            texts (pd.Series): A list or pandas Series of text documents to be processed.
+        This function removes the least recently used cached word counts (left by older corpora, stop words
+        or tokenizer versions), keeping at most CORPUS_CACHE_MAX_ENTRIES entries including the new one.
 
-        Returns:
-            This function return nothing. It is used for updating word frequency.
+        Args:
+            cache_filepath (str): Path of the cache file just written (always kept).
         """
-        # Concatenate all the text from the corpus text
-        deleted_text = ' '.join(corpus_texts)
-        deleted_word_freq = self.extract_word_freq(text=deleted_text, stopwords=self.stopwords)
-        
-        if not deleted_word_freq:
-            return None
+        entries = []
+        for entry in os.scandir(CORPUS_CACHE_DIRPATH):
+            name, extension = os.path.splitext(entry.name)
+            if extension != ".txt" or len(name) != 40 or entry.path == cache_filepath:
+                continue
+            try:
+                entries.append((entry.stat().st_mtime, entry.path))
+            except FileNotFoundError:
+                continue
 
-        # Decrease freq value for each word into the word_freq dictionary        
-        for word, freq in deleted_word_freq.items():
-            if word in self.word_freq.keys():
-                new_freq = self.word_freq[word] - freq
-                
-                # Remove word from dictionary if the new freq drop to 0 or below
-                if new_freq > 0:
-                    self.word_freq[word] = new_freq
-                else:
-                    self.word_freq.pop(word, None)
+        # Newest first: the entries past the limit are removed (maybe concurrently by another instance)
+        entries.sort(reverse=True)
+        for _, entry_path in entries[CORPUS_CACHE_MAX_ENTRIES - 1:]:
+            try:
+                os.remove(entry_path)
+            except FileNotFoundError:
+                pass
 
-    def load(self) -> None:
+    def load(self, storage: Optional[str] = None) -> None:
         # YOUR CODES START HERE
         """
         Load the vocabulary and word frequency from provided file paths
         and update value in word2idx, word_freq, idx2word
         of the instance.
+
+        With the binary storage, the vocabulary file is memory-mapped and word2idx, word_freq,
+        idx2word are read-only mappings resolved lazily from it (converted to dictionaries
+        on the first update).
         
+        Args:
+            storage (str | None): Format to load from ("text", "consolidated" or "binary"),
+            default to the instance storage.
+
         Returns:
             This function does not return anything. It loads the vocabulary and word frequency.
         """
-        self.word_freq = self._load_word_freq(WORD_FREQ_FILEPATH)
-        self.word2idx = self._load_word2idx(WORD2IDX_FILEPATH)
-        self.idx2word = self._load_idx2word(IDX2WORD_FILEPATH)
+        storage = self._check_storage(storage or self.storage)
+        self._snapshot_changes = None
+
+        if storage == STORAGE_BINARY:
+            self._load_vocab_bin(VOCAB_BIN_FILEPATH)
+        else:
+            self._binary_vocab = None
+            if storage == STORAGE_CONSOLIDATED:
+                self.word_freq, self.word2idx, self.idx2word = self._load_vocab(VOCAB_FILEPATH)
+            else:
+                self.word_freq = self._load_word_freq(WORD_FREQ_FILEPATH)
+                self.word2idx = self._load_word2idx(WORD2IDX_FILEPATH)
+                self.idx2word = self._load_idx2word(IDX2WORD_FILEPATH)
+
+            # Sync the vocabulary indexes with the loaded dictionaries
+            self._sorted_words = [self.idx2word[index] for index in range(len(self.idx2word))]
+            self._freq_index = FrequencyIndex(self.word_freq)
+            self._added_words.clear()
+            self._removed_words.clear()
+
+        self._reset_vocab_listeners()
+
+        # Replay the updates logged since the vocabulary was saved
+        if self.journal:
+            self._replay_journal(storage)
+
+        # The vocabulary matches the saved files
+        self._dirty = False
+        self._needs_save = False
+        _pending_flushes.discard(self)
+        self.vocab_version += 1
+        self._publish_snapshot()
     
     # ========== LOAD FILE FUNCTION WITH PRIVATE HELPERS ==========
         
@@ -174,9 +1622,51 @@ class TextProcessor:
         with open(filepath) as f:
             mapping_dict = json.load(f)
             
+        # Cast the datatype of label column to int same data type with corpus (once, at load)
         label_df = pd.DataFrame(mapping_dict.items(), columns=["label", "label_name"])
+        label_df["label"] = label_df["label"].astype(int)
         return label_df
 
+    def _load_vocab(self, filepath: str) -> Tuple[Dict[str, int], Dict[str, int], Dict[int, str]]:
+        """
+        Load the consolidated vocabulary file vocab.txt, and derive both directions of the index from it.
+        Args:
+            filepath (str): the path of the consolidated vocabulary file.
+
+        Returns:
+            Tuple[Dict[str, int], Dict[str, int], Dict[int, str]]: word_freq, word2idx and idx2word dictionaries.
+        """
+        word_freq = {}
+        words_by_index = {}
+        with open(filepath, "r") as f:
+            for line in f:
+                word, index, count = line.strip().split()
+                word_freq[word] = int(count)
+                words_by_index[int(index)] = word
+
+        # Store idx2word / word2idx in index order
+        idx2word = {index: words_by_index[index] for index in range(len(words_by_index))}
+        word2idx = {word: index for index, word in idx2word.items()}
+
+        return word_freq, word2idx, idx2word
+
+    def _load_vocab_bin(self, filepath: str) -> None:
+        """
+        Memory-map the binary vocabulary file, and set word_freq, word2idx, idx2word to read-only views of it.
+        Args:
+            filepath (str): the path of the binary vocabulary file.
+        """
+        self._binary_vocab = BinaryVocab(filepath)
+        self.word_freq = MappedWordFreq(self._binary_vocab)
+        self.word2idx = MappedWord2Idx(self._binary_vocab)
+        self.idx2word = MappedIdx2Word(self._binary_vocab)
+
+        # The vocabulary indexes are only built if the vocabulary is updated
+        self._sorted_words = None
+        self._freq_index = None
+        self._added_words.clear()
+        self._removed_words.clear()
+
     def _load_word_freq(self, filepath) -> Dict[str, int]:
         """
         Load the file word_freq.txt.
@@ -230,21 +1720,43 @@ class TextProcessor:
         return idx2word
     
     # ========== SAVE FILE FUNCTION WITH PRIVATE HELPERS ==========
-    def save(self) -> None:
+    def save(self, storage: Optional[str] = None) -> None:
         """
         This function save the vocabulary and word frequency , word2idx, and idx2word to
-        word_freq.txt, word2idx.txt, and idx2word.txt.
+        word_freq.txt, word2idx.txt, and idx2word.txt (text storage), to vocab.txt (consolidated storage)
+        or to vocab.bin (binary storage). With the journal, the delta log is emptied.
+
+        Args:
+            storage (str | None): Format to save to ("text", "consolidated" or "binary"),
+            default to the instance storage.
 
         Returns:
             This function does not return anything. It save the vocabulary and word frequency.
         """
+        storage = self._check_storage(storage or self.storage)
+
         # Update word2idx and idx2word dictionaries to prevent duplications
+        self._materialise_vocab()
         self._update_word_idx_dicts()
 
-        # Save 3 files
-        self._save_word_freq(WORD_FREQ_FILEPATH)
-        self._save_word2idx(WORD2IDX_FILEPATH)
-        self._save_idx2word(IDX2WORD_FILEPATH)
+        # Save a single vocabulary file, or 3 files
+        if storage == STORAGE_CONSOLIDATED:
+            self._save_vocab(VOCAB_FILEPATH)
+        elif storage == STORAGE_BINARY:
+            self._save_vocab_bin(VOCAB_BIN_FILEPATH)
+        else:
+            self._save_word_freq(WORD_FREQ_FILEPATH)
+            self._save_word2idx(WORD2IDX_FILEPATH)
+            self._save_idx2word(IDX2WORD_FILEPATH)
+
+        # The saved vocabulary holds every update -> start a new log on top of it
+        if self.journal:
+            self._reset_journal(storage)
+
+        self._dirty = False
+        self._needs_save = False
+        _pending_flushes.discard(self)
+        self._publish_snapshot()
 
     def _save_word_freq(self, filepath: Optional[str] = 'word_freq.txt') -> None:
         """
@@ -256,12 +1768,41 @@ class TextProcessor:
         Returns:
             This function does not return anything.
         """
-        # Sort the word_freq dictionary
-        word_sorted_by_freq = self.get_word_sorted_by_freq(self.word_freq)
+        # Sort the word_freq dictionary (already ordered by the frequency index)
+        word_sorted_by_freq = self._get_freq_index().iter_sorted()
         
         # Write a new line for each word and its freq
-        with open(filepath, 'w') as f:
-            f.write("".join((f"{word} {freq}\n" for word, freq in word_sorted_by_freq)))
+        atomic_write(filepath, "".join((f"{word} {freq}\n" for word, freq in word_sorted_by_freq)))
+
+    def _save_vocab(self, filepath: str) -> None:
+        """
+        Save the consolidated vocabulary file: one line "word index freq" for each word,
+        in descending order of frequency.
+        
+        Args:
+            filepath: The path of saving file.
+
+        Returns:
+            This function does not return anything.
+        """
+        word2idx = self.word2idx
+        word_sorted_by_freq = self._freq_index.iter_sorted()
+
+        atomic_write(filepath, "".join((
+            f"{word} {word2idx[word]} {freq}\n" for word, freq in word_sorted_by_freq
+        )))
+
+    def _save_vocab_bin(self, filepath: str) -> None:
+        """
+        Save the vocabulary to a binary vocabulary file.
+        
+        Args:
+            filepath: The path of saving file.
+
+        Returns:
+            This function does not return anything.
+        """
+        BinaryVocab.write(filepath, self._sorted_words, self.word_freq, self._freq_index.iter_sorted())
 
     def _save_word2idx(self, filepath) -> None:
         """
@@ -273,10 +1814,8 @@ class TextProcessor:
         Returns:
             This function does not return anything.
         """
-        # Save word2idx
-        with open(filepath, 'w') as f:
-            # use join with generator expression
-            f.write("".join(f"{word} {index}\n" for word, index in self.word2idx.items()))
+        # Save word2idx, use join with generator expression (idx2word is in index order)
+        atomic_write(filepath, "".join(f"{word} {index}\n" for index, word in self.idx2word.items()))
 
     def _save_idx2word(self, filepath) -> None:
         """
@@ -288,10 +1827,8 @@ class TextProcessor:
         Returns:
             This function does not return anything.
         """
-        # Save idx2word
-        with open(filepath, 'w') as f:
-            # use join with generator expression
-            f.write("".join(f"{index} {word}\n" for index, word in self.idx2word.items()))
+        # Save idx2word, use join with generator expression
+        atomic_write(filepath, "".join(f"{index} {word}\n" for index, word in self.idx2word.items()))
 
     def get_word_sorted_by_freq(self, word_freq: Dict[str, int]) -> List[tuple]:
         """
@@ -312,6 +1849,32 @@ class TextProcessor:
         
         return word_sorted_by_freq
 
+    def get_top_words(self, k: int) -> List[Tuple[str, int]]:
+        """
+        This function gets the k most frequent words of the vocabulary from the frequency index,
+        without sorting the whole vocabulary.
+        
+        Args:
+            1. k (int): the number of words.
+        
+        Returns:
+            List[Tuple[str, int]]: the same tuples (word, frequency) as get_word_sorted_by_freq(word_freq)[:k].
+        """
+        return self._get_freq_index().get_top(k)
+
+    def get_bottom_words(self, k: int) -> List[Tuple[str, int]]:
+        """
+        This function gets the k least frequent words of the vocabulary from the frequency index,
+        without sorting the whole vocabulary.
+        
+        Args:
+            1. k (int): the number of words.
+        
+        Returns:
+            List[Tuple[str, int]]: the same tuples (word, frequency) as get_word_sorted_by_freq(word_freq)[-k:].
+        """
+        return self._get_freq_index().get_bottom(k)
+
     # ==================== PUBLIC HELPERS ====================
     
     def extract_stopwords(self, stopwords_file: str) -> List[str]:
@@ -333,41 +1896,27 @@ class TextProcessor:
 
         return stopwords
 
-    def extract_word_freq(self, text: str, stopwords: list[str]) -> Dict[str, int]:
+    def extract_word_freq(self, text: str, stopwords: list[str] | StopwordIndex) -> Dict[str, int]:
         """
         This function splits the text into words and count number of time each word appears.
         Exclude any word that is a stopword
 
         Args:
             text (str): the unformatted text string.
-            stopwords (list[str]): Words to be filtered out.
+            stopwords (list[str] | StopwordIndex): Words to be filtered out.
 
         Returns:
             Dict[str, int]: A dictionary contain words and its amount.
         """
-        if not text:
-            return {}
-
-        # process the text, extract the word list and generate a dictionary containing word count
-        words = self._get_words(text)
-        words_dict = {} 
-
-        for word in words:
-            # Skip if word is a stopword
-            if word in stopwords:
-                continue
-
-            # add / update word into dictionary
-            if word not in words_dict.keys():
-                words_dict[word] = 1
-            else:
-                words_dict[word] += 1
-
-        # --- MAIN OUTPUT: return the result tuple (if the dictionary is not empty)
-        return words_dict
+        return count_words(text, stopwords, self._get_words)
 
     # ==================== PRIVATE HELPERS ====================
-    def _get_corpus(self, corpus_filepath: str, label_df: pd.DataFrame) -> pd.DataFrame:
+    def _get_corpus(
+            self,
+            corpus_filepath: str,
+            label_df: pd.DataFrame,
+            text_only: bool = False
+        ) -> pd.DataFrame:
         """
         This function process the merging of the label dataframe and corpus dataframe 
         and return the existing corpus with a new column: label_name
@@ -375,22 +1924,309 @@ class TextProcessor:
         Args:
             1. corpus_filepath (str):  Path of the corpus file.
             2. label_df (pandas.DataFrame): Label data frame.
+            3. text_only (bool): Whether only the text and label columns are needed (no label_name).
 
         Returns:
             pandas.DataFrame: Corpus dataframe after join, with a label_name column.
         """
-        # Cast the datatype of label column in label dataframe to int same data type with corpus
-        label_df["label"] = label_df["label"].astype(int)
-        corpus_df = pd.read_csv(corpus_filepath)
+        usecols = ["text", "label"] if text_only else None
+        corpus_df = pd.read_csv(corpus_filepath, usecols=usecols)
+
+        return self._join_label_names(corpus_df, label_df, text_only)
+
+    def _iter_corpus(
+            self,
+            corpus_filepath: str,
+            label_df: pd.DataFrame,
+            text_only: bool = False
+        ) -> Iterator[pd.DataFrame]:
+        """
+        This function streams the corpus file in chunks of chunk_rows rows, each chunk
+        joined with the label dataframe the same way as _get_corpus.
+        
+        Args:
+            1. corpus_filepath (str):  Path of the corpus file.
+            2. label_df (pandas.DataFrame): Label data frame.
+            3. text_only (bool): Whether only the text and label columns are needed (no label_name).
+
+        Returns:
+            Iterator[pandas.DataFrame]: Corpus dataframe chunks after join, with a label_name column.
+        """
+        if self.chunk_rows is None:
+            yield self._get_corpus(corpus_filepath, label_df, text_only)
+            return
+
+        usecols = ["text", "label"] if text_only else None
+        with pd.read_csv(corpus_filepath, usecols=usecols, chunksize=self.chunk_rows) as reader:
+            for corpus_df in reader:
+                yield self._join_label_names(corpus_df, label_df, text_only)
+
+    def _join_label_names(
+            self,
+            corpus_df: pd.DataFrame,
+            label_df: pd.DataFrame,
+            text_only: bool = False
+        ) -> pd.DataFrame:
+        """
+        This function attaches the label name of each row with a vectorised lookup, and keeps only
+        the rows with a known label (same result as an inner merge on the label column).
+        
+        Args:
+            1. corpus_df (pandas.DataFrame): Corpus data frame.
+            2. label_df (pandas.DataFrame): Label data frame.
+            3. text_only (bool): Whether only the rows are filtered (no label_name column).
+
+        Returns:
+            pandas.DataFrame: Corpus dataframe after join, with a label_name column.
+        """
+        # The lookup of the instance label dataframe is only built once
+        if label_df is self.idx2label:
+            label_names = self._label_names
+        else:
+            label_names = self._get_label_names(label_df)
+
+        if text_only:
+            joined_df = corpus_df
+            known_labels = corpus_df["label"].isin(label_names.index)
+        else:
+            joined_df = corpus_df.assign(label_name=corpus_df["label"].map(label_names))
+            known_labels = joined_df["label_name"].notna()
+
+        if not known_labels.all():
+            joined_df = joined_df[known_labels]
+
+        return joined_df.reset_index(drop=True)
+
+    def _get_label_names(self, label_df: pd.DataFrame) -> pd.Series:
+        """
+        This function builds the lookup of label names indexed by the (int) label.
+        
+        Args:
+            1. label_df (pandas.DataFrame): Label data frame.
+
+        Returns:
+            pandas.Series: Label names indexed by label.
+        """
+        return pd.Series(
+            label_df["label_name"].to_numpy(),
+            index=label_df["label"].astype(int).to_numpy()
+        )
+
+    def _count_corpus_words(
+            self,
+            corpus_texts: List[str] | pd.Series,
+            pool: Optional[ProcessPoolExecutor] = None
+        ) -> Dict[str, int]:
+        """
+        This function counts the words (excluding stopwords) of the corpus texts, chunk_rows texts
+        at a time so that only one chunk is ever concatenated into a single string.
+        With a process pool, the chunks are sharded across its workers, with at most
+        PARALLEL_TASKS_PER_WORKER chunks in flight per worker, and the word count of each
+        chunk is merged in order.
         
-        # Merge corpus and label dataframe
-        joined_df = pd.merge(corpus_df, label_df, on="label", how="inner")
-        return joined_df
+        Args:
+            1. corpus_texts (List[str] | pd.Series): A list or pandas Series of text documents.
+            2. pool (ProcessPoolExecutor | None): The process pool counting the words (None: in process).
+
+        Returns:
+            Dict[str, int]: A dictionary contain words and its amount.
+        """
+        # Split the texts into chunks (at least one per worker of the pool)
+        chunk_rows = max(math.ceil(len(corpus_texts) / (self.workers if pool is not None else 1)), 1)
+        if self.chunk_rows is not None:
+            chunk_rows = min(chunk_rows, self.chunk_rows)
+
+        chunk_texts = (
+            ' '.join(corpus_texts[start:start + chunk_rows])
+            for start in range(0, len(corpus_texts), chunk_rows)
+        )
+
+        if pool is not None:
+            chunk_word_freqs = self._iter_pool_word_freqs(pool, chunk_texts)
+        else:
+            chunk_word_freqs = (
+                self.extract_word_freq(text=chunk_text, stopwords=self.stopword_index)
+                for chunk_text in chunk_texts
+            )
+
+        # Merge the word count of each chunk
+        word_freq = {}
+        for chunk_word_freq in chunk_word_freqs:
+            for word, freq in chunk_word_freq.items():
+                word_freq[word] = word_freq.get(word, 0) + freq
+
+        return word_freq
+
+    def _iter_pool_word_freqs(self, pool: ProcessPoolExecutor, chunk_texts: Iterable[str]) -> Iterator[Dict[str, int]]:
+        """
+        This function counts the words of the chunks in the process pool, submitting a new chunk
+        only once one in flight is done (the chunk texts are joined lazily).
+
+        Args:
+            1. pool (ProcessPoolExecutor): The process pool counting the words.
+            2. chunk_texts (Iterable[str]): The joined texts of the chunks.
+
+        Returns:
+            Iterator[Dict[str, int]]: The word count of each chunk, in order.
+        """
+        max_in_flight = self.workers * PARALLEL_TASKS_PER_WORKER
+        futures = deque()
+
+        for chunk_text in chunk_texts:
+            if len(futures) >= max_in_flight:
+                yield futures.popleft().result()
+            futures.append(pool.submit(count_words, chunk_text, self.stopword_index, self.tokenizer))
+
+        while futures:
+            yield futures.popleft().result()
     
+    def _materialise_vocab(self) -> None:
+        """
+        This function converts the read-only memory-mapped vocabulary (after a binary load)
+        into dictionaries, before the vocabulary is updated or saved.
+        
+        Args:
+            None
+            
+        Returns:
+            None -> This function directly update the 3 instance variables
+        """
+        if self._binary_vocab is None:
+            return None
+
+        self.word_freq = dict(self.word_freq)
+        self.word2idx = dict(self.word2idx)
+        self.idx2word = dict(self.idx2word)
+        self._binary_vocab = None
+
+        self._sorted_words = list(self.word2idx)
+        self._freq_index = FrequencyIndex(self.word_freq)
+
+    def get_snapshot(self) -> Optional[VocabSnapshot]:
+        """
+        This function gets the last published snapshot of the vocabulary. It is never modified:
+        an update publishes a new snapshot once it is complete, so readers can keep using the
+        snapshot they hold while another thread updates the vocabulary.
+        
+        Returns:
+            Optional[VocabSnapshot]: the last published snapshot (None without snapshots).
+        """
+        return self._snapshot
+
+    def _publish_snapshot(self) -> None:
+        """
+        This function publishes a snapshot of the current vocabulary (with snapshots, and only if
+        the vocabulary changed since the last snapshot). The new snapshot is built from the words
+        changed since the last one (or from the whole vocabulary after it was replaced), completely
+        before it replaces the previous one in a single assignment.
+        """
+        if not self.snapshots:
+            return None
+
+        if self._snapshot is not None and self._snapshot.version == self.vocab_version:
+            return None
+
+        # Free the snapshot before the previous one here, in the writer: a reader dropping the
+        # last reference of an old snapshot would pay for freeing its copied partitions / blocks
+        self._previous_snapshot = self._snapshot
+
+        if self._snapshot is None or self._snapshot_changes is None:
+            self._snapshot = VocabSnapshot.from_vocab(self.vocab_version, self.word_freq, self._get_freq_index())
+        else:
+            self._snapshot = self._snapshot.updated(self.vocab_version, self._snapshot_changes, self._get_freq_index())
+
+        self._snapshot_changes = {}
+
+    def _get_freq_index(self) -> FrequencyIndex:
+        """
+        This function gets the frequency index of the vocabulary, building it if it was reset.
+        
+        Returns:
+            FrequencyIndex: the frequency index (updated by each add / delete).
+        """
+        if self._freq_index is None:
+            self._freq_index = FrequencyIndex(self.word_freq)
+
+        return self._freq_index
+
+    def _check_storage(self, storage: str) -> str:
+        """
+        This function checks the vocabulary storage format is supported.
+        
+        Args:
+            storage (str): the storage format.
+            
+        Returns:
+            str: the storage format.
+        """
+        if storage not in STORAGES:
+            raise ValueError(f"Unsupported vocabulary storage: {storage}")
+
+        return storage
+
+    def _check_persist(self, persist: str) -> str:
+        """
+        This function checks the vocabulary persistence policy is supported.
+        
+        Args:
+            persist (str): the persistence policy.
+            
+        Returns:
+            str: the persistence policy.
+        """
+        if persist not in PERSIST_POLICIES:
+            raise ValueError(f"Unsupported vocabulary persistence: {persist}")
+
+        return persist
+
     def _update_word_idx_dicts(self) -> None:
+        """
+        This function update the word2idx and idx2word dictionaries based on the current word_freq.
+        Only the words inserted / removed since the last update are applied to the sorted word list,
+        and only the indexes from the first shifted position are recomputed.
+        
+        Args:
+            None
+            
+        Returns:
+            None -> This function directly update the 2 instance variables
+        """
+        if self._sorted_words is None:
+            self._rebuild_word_idx_dicts()
+            return None
+
+        sorted_words = self._sorted_words
+        old_size = len(sorted_words)
+        first_shifted = old_size
+
+        # Remove / insert the changed words, keeping the word list in alphabetical order
+        for word in self._removed_words:
+            index = bisect_left(sorted_words, word)
+            del sorted_words[index]
+            del self.word2idx[word]
+            first_shifted = min(first_shifted, index)
+
+        for word in self._added_words:
+            index = bisect_left(sorted_words, word)
+            sorted_words.insert(index, word)
+            first_shifted = min(first_shifted, index)
+
+        self._added_words.clear()
+        self._removed_words.clear()
+
+        # Recompute the indexes which shifted, and drop the indexes past the end of the list
+        for index in range(first_shifted, len(sorted_words)):
+            word = sorted_words[index]
+            self.word2idx[word] = index
+            self.idx2word[index] = word
+
+        for index in range(len(sorted_words), old_size):
+            del self.idx2word[index]
+
+    def _rebuild_word_idx_dicts(self) -> None:
         """
         This function clear the existing data in word2idx and idx2word dictionaries,
-        and update its content based on the current word_freq to prevent duplicated data
+        and rebuild its content and the frequency index from the current word_freq
         
         Args:
             None
@@ -401,60 +2237,30 @@ class TextProcessor:
         # Clear all data in word2idx and idx2word for preventing duplicate with old data
         self.word2idx.clear()
         self.idx2word.clear()
+        self._added_words.clear()
+        self._removed_words.clear()
 
         # Update word2idx & idx2word dictionaries, store content in alphebetical order
-        word_sorted_by_name = sorted(self.word_freq.keys())
+        self._sorted_words = sorted(self.word_freq.keys())
 
-        for index, word in enumerate(word_sorted_by_name):
+        for index, word in enumerate(self._sorted_words):
             self.word2idx[word] = index
             self.idx2word[index] = word
+
+        self._freq_index = FrequencyIndex(self.word_freq)
     
     def _get_words(self, text: str) -> List[str]:
         """
         This function extract a list of (lowercase) cleaned words from the input text
-        based on the given requirements
+        with the tokenizer of the instance.
 
         Args:
             1. text (str): the input text string
         
         Returns:
             words (List[str]): a list of lowercase words
-
-        Requirements:
-            1. all words have been converted to lowercase
-            2. clean all the punctuations and contractions
-            3. filtering out numbers and words composed entirely of digits
-            4. discarding words with a length less than 2
         """
-        # CONSTANTS
-        PUNTUATIONS = "!\"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~"
-        
-        # iterate each character, form into a word and add to word list
-        words = []
-        
-        word_buffer = ""
-        for char in text:
-            # While buffer is empty -> skip the character if it is a blank space / a delimeter
-            if not word_buffer and (char.isspace() or char in PUNTUATIONS):
-                continue
-
-            # Add character to buffer, extract (lowercase) word to list, and reset buffer
-            if char not in PUNTUATIONS and not char.isspace(): 
-                word_buffer += char
-            else:
-                # check if buffer has a valid length and contain no number
-                word = word_buffer.lower()
-
-                if len(word) >= 2 and not self._check_word_has_number(word):
-                    words.append(word)
-                    
-                word_buffer = "" # reset buffer
-            
-        # Add the remaining buffer (last word) to list (must satisfy requirements)
-        if word_buffer and len(word_buffer) >= 2 and not self._check_word_has_number(word_buffer):
-            words.append(word_buffer.lower())
-
-        return words
+        return self.tokenizer(text)
 
     def _check_word_has_number(self, word: str) -> bool:
         """
@@ -467,13 +2273,32 @@ class TextProcessor:
             bool: a boolean check if that function has a number or not.
 
         """
-        for char in word:
-            if char.isdigit():
-                return True
-
-        return False
+        return check_word_has_number(word)
 
     # ==================== GETTERS & SETTERS ====================
+    @property
+    def corpus(self) -> pd.DataFrame:
+        """
+        Get the corpus dataframe (loaded from corpus_filepath on each access with lazy_corpus).
+        
+        Returns:
+            pandas.DataFrame: Corpus dataframe with a label_name column.
+        """
+        if self._corpus is None:
+            return self._get_corpus(self.corpus_filepath, self.idx2label)
+
+        return self._corpus
+
+    @corpus.setter
+    def corpus(self, corpus: pd.DataFrame) -> None:
+        """
+        Set the corpus dataframe.
+        
+        Args:
+            corpus (pandas.DataFrame): Corpus dataframe with a label_name column.
+        """
+        self._corpus = corpus
+
     def get_word_freq(self) -> Dict[str, int]:
         """
         Get the word frequency.
@@ -493,8 +2318,19 @@ class TextProcessor:
         Returns:
             This function does not return anything.
         """
+        self._materialise_vocab()
         self.word_freq = word_freq
 
+        # The vocabulary indexes (and the next snapshot) no longer match -> rebuild them
+        self._sorted_words = None
+        self._freq_index = None
+        self._snapshot_changes = None
+        self._reset_vocab_listeners()
+
+        # Only a whole save writes the new vocabulary
+        self._mark_dirty(needs_save=True)
+        self.vocab_version += 1
+
     def get_word2idx(self) -> Dict[str, int]:
         """
         Get the word2idx.
@@ -548,7 +2384,7 @@ class TextProcessor:
 
     def set_stopwords(self, stopwords: List[str]) -> None:
         """
-        Set the stopwords.
+        Set the stopwords (and rebuild the stopword index).
         
         Args:
             stopwords (List[str]): a list of strings (the stop words).
@@ -557,6 +2393,16 @@ class TextProcessor:
             This function does not return anything.
         """
         self.stopwords = stopwords
+        self.stopword_index = StopwordIndex(stopwords)
+
+    def get_stopword_index(self) -> StopwordIndex:
+        """
+        Get the stopword index.
+        
+        Returns:
+            StopwordIndex: the hash-set index of the stop words.
+        """
+        return self.stopword_index
 
 
 if __name__ == "__main__":
@@ -1,6 +1,6 @@
 from typing import Optional
 import os
-from task7 import TextProcessor
+from task7 import PERSIST_EAGER, TextProcessor
 
 
 
@@ -84,7 +84,10 @@ class RoleBasedVocabSys:
         self.current_user = None
         self.text_processor = TextProcessor(stopwords_filepath,
                                             corpus_filepath,
-                                            idx2label_filepath)
+                                            idx2label_filepath,
+                                            lazy_corpus=True,
+                                            corpus_cache=True,
+                                            persist=PERSIST_EAGER)
 
     def start(self):
         # YOUR CODES START HERE
@@ -111,8 +114,6 @@ class RoleBasedVocabSys:
 
             access = self.current_user.get_access()
 
-            word_list = self.text_processor.get_word_sorted_by_freq()
-
             # Action when user log in for both reader and admin
             if user_choice == "1":
                 print("Exited")
@@ -124,14 +125,14 @@ class RoleBasedVocabSys:
             # Print top 10 frequency words
             elif user_choice == "3":
                 print("====================")
-                for wrd, frq in word_list[:10]:
+                for wrd, frq in self.text_processor.get_top_words(10):
                     print(f"{wrd} {frq}")
                 print("====================")
                 continue
             # Print bottom 10 frequency words
             elif user_choice == "4":
                 print("====================")
-                for wrd, frq in word_list[-10:]:
+                for wrd, frq in self.text_processor.get_bottom_words(10):
                     print(f"{wrd} {frq}")
                 print("====================")
                 continue
@@ -1,6 +1,486 @@
-from task7 import TextProcessor
+from task7 import PUNCTUATIONS, TextProcessor
+import json
 import math
-from typing import Dict
+import re
+import numpy as np
+import multiprocessing
+from bisect import bisect_left
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import chain
+from time import perf_counter
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+# CONSTANTS - rarity points of a word by its corpus frequency: 1-3, 4-20, 21-50, 51-100, > 100
+RARITY_FREQ_BOUNDS = (3, 20, 50, 100)
+RARITY_POINTS = (5, 4, 3, 2, 1)
+UNKNOWN_WORD_POINTS = -1
+
+# CONSTANTS - number of characters read at a time from an essay file
+ESSAY_CHUNK_SIZE = 1 << 16
+
+# CONSTANTS - a chunk of an essay ends after its last word delimiter (whitespace or punctuation of the tokenizer)
+CHUNK_END_PATTERN = re.compile("(?s).*[\\s" + re.escape(PUNCTUATIONS) + "]")
+
+# CONSTANTS - number of problem statements kept by the topic words cache
+TOPIC_CACHE_SIZE = 32
+
+# Scorer shared by the worker processes of score_essays (set once per worker by _init_worker)
+_worker_scorer = None
+
+def _init_worker(scorer: "EssayScorer") -> None:
+    """
+    This function stores the scorer in a worker process of score_essays.
+    With the fork start method the scorer is inherited from the parent, so the
+    TextProcessor vocabulary is shared copy-on-write instead of pickled for every essay.
+
+    Args:
+        1. scorer (EssayScorer): The scorer used by the worker.
+    """
+    global _worker_scorer
+    _worker_scorer = scorer
+
+    # The timings are sent back to the parent, which aggregates them (and writes the JSON lines)
+    if scorer.stats is not None:
+        scorer.stats = ScoringStats()
+
+def _score_essay_worker(
+        prob_statement: str,
+        file_path: str
+    ) -> Tuple[str, Dict[str, float], Optional[Dict[str, float]]]:
+    """
+    This function scores one essay with the scorer of the worker process.
+    Defined at module level so it can be sent to the worker processes.
+
+    Args:
+        1. prob_statement (str): The given problem statement.
+        2. file_path (str): The path to where the essay text file is located.
+
+    Returns:
+        Tuple[str, Dict[str, float], Optional[Dict[str, float]]]: The essay path, its scores
+        and its timings (None without instrumentation).
+    """
+    scores = _worker_scorer.score_essay(prob_statement, file_path)
+    stats = _worker_scorer.stats
+
+    return file_path, scores, stats.last_essay if stats is not None else None
+
+class ScoringStats:
+    """ ScoringStats Class - wall time and call count of each scoring stage, per essay and aggregated
+
+    The stages are "tokenize" (reading and counting the essay words) and the five criteria:
+    "length", "relevance", "rarity", "variety" and "penalty".
+
+    Instance variable:
+        1. jsonl_path (str | None): file the timings of each essay are appended to as a JSON line
+        2. essays (int): number of essays timed
+        3. calls (Dict[str, int]): number of calls of each stage
+        4. seconds (Dict[str, float]): total wall time of each stage
+        5. last_essay (Dict[str, float]): wall time of each stage for the last essay
+    """
+
+    def __init__(self, jsonl_path: Optional[str] = None) -> None:
+        """
+        ========== ScoringStats Constructor ==========
+
+        Initialises empty ScoringStats.
+
+        Args:
+            1. jsonl_path (str | None): File the timings of each essay are appended to
+            as a JSON line (default: None, not written).
+        """
+        self.jsonl_path = jsonl_path
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        This function clears the timings (e.g. before a new batch).
+        """
+        self.essays = 0
+        self.calls = {}
+        self.seconds = {}
+        self.last_essay = {}
+        self._essay = {}
+
+    def start_essay(self) -> None:
+        """
+        This function starts timing a new essay.
+        """
+        self._essay = {}
+
+    def record(self, stage: str, seconds: float) -> None:
+        """
+        This function records one call of a stage for the current essay.
+
+        Args:
+            1. stage (str): The stage name.
+            2. seconds (float): Its wall time.
+        """
+        self._essay[stage] = self._essay.get(stage, 0.0) + seconds
+
+    def finish_essay(self, file_path: str) -> None:
+        """
+        This function adds the timings of the current essay to the totals.
+
+        Args:
+            1. file_path (str): The path of the essay.
+        """
+        self.add_essay(file_path, self._essay)
+
+    def add_essay(self, file_path: str, timings: Dict[str, float]) -> None:
+        """
+        This function adds the timings of one essay (possibly timed by another process) to the totals,
+        and appends them to the JSON lines file.
+
+        Args:
+            1. file_path (str): The path of the essay.
+            2. timings (Dict[str, float]): The wall time of each stage for the essay.
+        """
+        self.essays += 1
+        self.last_essay = timings
+
+        for stage, seconds in timings.items():
+            self.calls[stage] = self.calls.get(stage, 0) + 1
+            self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+
+        if self.jsonl_path is not None:
+            with open(self.jsonl_path, "a") as f:
+                f.write(json.dumps({"path": file_path, "seconds": timings}) + "\n")
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        This function summarises the timings of all the essays.
+
+        Returns:
+            Dict[str, Any]: The number of essays, and for each stage its number of calls,
+            total wall time (s) and mean wall time per call (ms).
+        """
+        return {
+            'essays': self.essays,
+            'stages': {
+                stage: {
+                    'calls': self.calls[stage],
+                    'total_s': self.seconds[stage],
+                    'mean_ms': self.seconds[stage] / self.calls[stage] * 1000
+                }
+                for stage in self.calls
+            }
+        }
+
+def read_text_chunks(file_path: str, chunk_size: int = ESSAY_CHUNK_SIZE) -> Iterator[str]:
+    """
+    This function reads a text file chunk_size characters at a time. Each chunk is cut after
+    its last word delimiter, whitespace or punctuation (the rest is carried over to the next chunk),
+    so no word is split across chunks and only a word longer than chunk_size is carried over whole.
+
+    Args:
+        1. file_path (str): The path to the text file.
+        2. chunk_size (int): Number of characters read at a time (default: 65536).
+
+    Returns:
+        Iterator[str]: The text chunks.
+    """
+    carry = []
+    with open(file_path, "r") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+
+            # Find the start of the (possibly incomplete) last word of the chunk
+            chunk_end = CHUNK_END_PATTERN.match(chunk)
+            if chunk_end is None:
+                carry.append(chunk)
+                continue
+
+            end = chunk_end.end()
+            yield "".join(carry) + chunk[:end]
+            carry = [chunk[end:]]
+
+    if any(carry):
+        yield "".join(carry)
+
+class EssayFeatures:
+    """ EssayFeatures Class - the word counts of an essay, extracted once and shared by all the marking criteria
+
+    Instance variable:
+        1. word_freq (Dict[str, int]): frequency of every word in the essay (including stopwords)
+        2. content_word_freq (Dict[str, int]): frequency of the non-stopwords in the essay
+        3. word_count (int): total number of words in the essay
+        4. content_word_count (int): total number of non-stopwords in the essay
+        5. stopword_count (int): total number of stopwords in the essay
+        6. has_text (bool): whether the essay has any non-whitespace character
+    """
+
+    def __init__(self, essay: str, text_processor: TextProcessor):
+        """
+        ========== EssayFeatures Constructor ==========
+
+        Tokenizes the essay once and counts its words, non-stopwords and stopwords.
+
+        Args:
+            1. essay (str): The essay text.
+            2. text_processor (TextProcessor): The text processor splitting the essay into words
+            and providing the stopwords.
+        """
+        self.has_text = bool(essay) and not essay.isspace()
+        self._count_words(text_processor.extract_word_freq(essay, []), text_processor)
+
+    @classmethod
+    def from_file(
+            cls,
+            file_path: str,
+            text_processor: TextProcessor,
+            chunk_size: int = ESSAY_CHUNK_SIZE
+        ) -> "EssayFeatures":
+        """
+        This function streams an essay file chunk by chunk and merges the word counts of each chunk,
+        so that only one chunk of the essay and its word counts are held in memory.
+
+        Args:
+            1. file_path (str): The path to where the essay text file is located.
+            2. text_processor (TextProcessor): The text processor splitting the essay into words
+            and providing the stopwords.
+            3. chunk_size (int): Number of characters read at a time (default: 65536).
+
+        Returns:
+            EssayFeatures: The word counts of the essay (same as built from the whole essay text).
+        """
+        features = cls.__new__(cls)
+        features.has_text = False
+
+        word_freq = {}
+        for chunk in read_text_chunks(file_path, chunk_size):
+            if not features.has_text:
+                features.has_text = not chunk.isspace()
+
+            for word, freq in text_processor.extract_word_freq(chunk, []).items():
+                word_freq[word] = word_freq.get(word, 0) + freq
+
+        features._count_words(word_freq, text_processor)
+        return features
+
+    def _count_words(self, word_freq: Dict[str, int], text_processor: TextProcessor) -> None:
+        """
+        This function splits the essay word counts into non-stopwords and stopwords.
+
+        Args:
+            1. word_freq (Dict[str, int]): Frequency of every word in the essay.
+            2. text_processor (TextProcessor): The text processor providing the stopwords.
+        """
+        stopwords = text_processor.get_stopword_index()
+
+        self.word_freq = word_freq
+        self.content_word_freq = {
+            word: freq for word, freq in self.word_freq.items() if word not in stopwords
+        }
+
+        self.word_count = sum(self.word_freq.values())
+        self.content_word_count = sum(self.content_word_freq.values())
+        self.stopword_count = self.word_count - self.content_word_count
+
+class RarityIndex:
+    """ RarityIndex Class - rarity points of every corpus word, precomputed from its frequency
+
+    Registered as a vocabulary listener of the TextProcessor, so that it is updated word by word
+    on add_file / delete_file instead of being rebuilt.
+
+    Instance variable:
+        1. points (Dict[str, int]): rarity points of each word in the corpus vocabulary
+    """
+
+    def __init__(self) -> None:
+        """
+        ========== RarityIndex Constructor ==========
+
+        Initialises an empty RarityIndex (filled by reset when registered).
+        """
+        self.points = {}
+
+    def reset(self, word_freq: Dict[str, int]) -> None:
+        """
+        This function rebuilds the rarity points of the whole vocabulary.
+
+        Args:
+            1. word_freq (Dict[str, int]): The corpus word frequencies.
+        """
+        self.points = {word: get_rarity_points(freq) for word, freq in word_freq.items()}
+
+    def update(self, word: str, old_freq: int, new_freq: int) -> None:
+        """
+        This function updates the rarity points of one word after its frequency changed.
+
+        Args:
+            1. word (str): The changed word.
+            2. old_freq (int): Its previous frequency (0: it was not in the vocabulary).
+            3. new_freq (int): Its new frequency (0: it was removed from the vocabulary).
+        """
+        if new_freq > 0:
+            self.points[word] = get_rarity_points(new_freq)
+        else:
+            self.points.pop(word, None)
+
+    def get_total_points(self, words: Iterable[str]) -> int:
+        """
+        This function sums the rarity points of the words, an unknown word being worth -1 point.
+
+        Args:
+            1. words (Iterable[str]): The (unique) words to score.
+
+        Returns:
+            int: The total rarity points.
+        """
+        points = self.points
+        return sum(points.get(word, UNKNOWN_WORD_POINTS) for word in words)
+
+def get_rarity_points(freq: int) -> int:
+    """
+    This function gets the rarity points of a word appearing freq times in the corpus.
+
+    Args:
+        1. freq (int): The corpus frequency of the word.
+
+    Returns:
+        int: The rarity points (-1 for an unknown word).
+    """
+    if freq <= 0:
+        return UNKNOWN_WORD_POINTS
+
+    return RARITY_POINTS[bisect_left(RARITY_FREQ_BOUNDS, freq)]
+
+class TopicWordCache:
+    """ TopicWordCache Class - LRU cache of the topic words of the problem statements
+
+    The topic words are keyed by the statement text and the stopword set they were extracted with,
+    so that a marking run extracts them once for all the essays, and again if the stopwords change.
+
+    Instance variable:
+        1. maxsize (int): maximum number of cached statements
+        2. hits (int): number of lookups served from the cache
+        3. misses (int): number of lookups extracting the topic words
+    """
+
+    def __init__(self, maxsize: int = TOPIC_CACHE_SIZE) -> None:
+        """
+        ========== TopicWordCache Constructor ==========
+
+        Initialises an empty TopicWordCache.
+
+        Args:
+            1. maxsize (int): Maximum number of cached statements (default: 32).
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._topic_words = OrderedDict()
+
+    def get_topic_words(self, prob_statement: str, text_processor: TextProcessor) -> FrozenSet[str]:
+        """
+        This function gets the topic words (excluding stopwords) of the problem statement,
+        extracting them only if the statement is not cached for the current stopwords.
+
+        Args:
+            1. prob_statement (str): The given problem statement.
+            2. text_processor (TextProcessor): The text processor splitting the statement into words
+            and providing the stopwords.
+
+        Returns:
+            FrozenSet[str]: The topic words.
+        """
+        stopwords = text_processor.get_stopword_index()
+        key = (prob_statement, stopwords.words)
+
+        topic_words = self._topic_words.get(key)
+        if topic_words is not None:
+            self.hits += 1
+            self._topic_words.move_to_end(key)
+            return topic_words
+
+        self.misses += 1
+        topic_words = frozenset(text_processor.extract_word_freq(prob_statement, stopwords))
+        self._topic_words[key] = topic_words
+
+        # Evict the least recently used statement
+        if len(self._topic_words) > self.maxsize:
+            self._topic_words.popitem(last=False)
+
+        return topic_words
+
+    def clear(self) -> None:
+        """
+        This function empties the cache and resets the hit / miss counters.
+        """
+        self._topic_words.clear()
+        self.hits = 0
+        self.misses = 0
+
+class DocumentTermMatrix:
+    """ DocumentTermMatrix Class - sparse word counts of a batch of essays (one row per essay)
+
+    The matrix is stored as NumPy arrays of its non-zero entries (coordinate format), sorted by row.
+    Its columns are the distinct words of the batch, stopwords and unknown words included.
+
+    Instance variable:
+        1. words (List[str]): the word of each column, in order of first appearance
+        2. rows (numpy.ndarray): the row (essay) of each entry
+        3. columns (numpy.ndarray): the column (word) of each entry
+        4. counts (numpy.ndarray): the number of times the word of the entry appears in the essay
+        5. n_docs (int): number of essays (rows)
+    """
+
+    def __init__(self, texts: List[str], tokenizer: Callable[[str], List[str]]) -> None:
+        """
+        ========== DocumentTermMatrix Constructor ==========
+
+        Tokenizes the essays and counts every (essay, word) pair of the batch at once.
+
+        Args:
+            1. texts (List[str]): The essay texts.
+            2. tokenizer (Callable[[str], List[str]]): Function splitting a text into cleaned words.
+        """
+        doc_words = [tokenizer(text) for text in texts]
+        self.n_docs = len(doc_words)
+
+        # Number every word of the batch with the column of its (distinct) word
+        word_columns = {}
+        token_columns = np.fromiter(
+            (word_columns.setdefault(word, len(word_columns)) for word in chain.from_iterable(doc_words)),
+            dtype=np.int64
+        )
+        self.words = list(word_columns)
+        token_rows = np.repeat(
+            np.arange(self.n_docs),
+            np.fromiter(map(len, doc_words), dtype=np.int64, count=self.n_docs)
+        )
+
+        # Count the (row, column) pairs, encoded as one integer key each
+        n_columns = max(len(self.words), 1)
+        keys, self.counts = np.unique(token_rows * n_columns + token_columns, return_counts=True)
+        self.rows, self.columns = np.divmod(keys, n_columns)
+
+    def get_column_mask(self, words: Iterable[str] | Dict[str, int]) -> np.ndarray:
+        """
+        This function flags the columns whose word is in the given words.
+
+        Args:
+            1. words (Iterable[str] | Dict[str, int]): A set-like collection of words (supporting "in").
+
+        Returns:
+            numpy.ndarray: Boolean array with one flag per column.
+        """
+        return np.fromiter((word in words for word in self.words), dtype=bool, count=len(self.words))
+
+    def get_row_sums(self, weights: np.ndarray) -> np.ndarray:
+        """
+        This function sums the weights of the entries of each row.
+
+        Args:
+            1. weights (numpy.ndarray): One weight per entry.
+
+        Returns:
+            numpy.ndarray: One sum per row (essay).
+        """
+        return np.bincount(self.rows, weights=weights, minlength=self.n_docs)
 
 class EssayScorer:
     """ EssayScorer Class - mark essay by the marking criteria
@@ -8,9 +488,13 @@ class EssayScorer:
     Instance variable:
         1. text_processor: the object use to process text and extract words for 
         essay marking purpose
+        2. rarity_index (RarityIndex): the rarity points of the corpus words, kept in sync
+        with the text_processor vocabulary
+        3. topic_cache (TopicWordCache): the cached topic words of the problem statements
+        4. stats (ScoringStats | None): the timings of the scoring stages (None: not instrumented)
     """
     
-    def __init__(self, text_processor):
+    def __init__(self, text_processor, stats: Optional[ScoringStats] = None):
         """
         ========== EssayScorer Constructor ==========
         
@@ -19,9 +503,15 @@ class EssayScorer:
         Args:
             1. text_processor (TextProcessor): A text-processor object that provides methods for
             word extraction, frequency counting, and stopword retrieval (relevant to this Task).
+            2. stats (ScoringStats | None): Records the wall time of the tokenization and of each
+            criterion when given (default: None, not instrumented).
         """
 
         self.text_processor = text_processor
+        self.rarity_index = RarityIndex()
+        self.text_processor.add_vocab_listener(self.rarity_index)
+        self.topic_cache = TopicWordCache()
+        self.stats = stats
 
     def score_essay(self, prob_statement: str, file_path: str) -> Dict[str, float]:
         """
@@ -53,13 +543,15 @@ class EssayScorer:
             print("Missing file_path parameter!")
             return {}
         
-        # Extract the essay text from the file_path
-        with open(file_path, "r") as f:
-            essay = f.read().strip()
+        if self.stats is not None:
+            self.stats.start_essay()
+
+        # Stream the essay from the file_path and extract its words once
+        features = self._timed("tokenize", EssayFeatures.from_file, file_path, self.text_processor)
 
-        if not essay:
+        if not features.has_text:
             print("Essay is not found!")
-            return {
+            scores = {
                 'length': 0.0,
                 'relevance': 0.0,
                 'rarity': 0.0,
@@ -67,33 +559,216 @@ class EssayScorer:
                 'penalty': 0.0,
                 'total_score': 0.0
             }
+        else:
+            # Calculate all the component score + the final total score
+            length_score = self._timed("length", self._get_length_score, features)
+            relevance_score = self._timed("relevance", self._get_relevance_score, prob_statement, features)
+            rarity_score = self._timed("rarity", self._get_rarity_score, features)
+            variety_score = self._timed("variety", self._get_variety_score, features)
+            penalty_score = self._timed("penalty", self._get_filler_penalty, features)
+
+            total_score = length_score + relevance_score + rarity_score + variety_score + penalty_score
+
+            scores = {
+                'length': length_score,
+                'relevance': relevance_score,
+                'rarity': rarity_score,
+                'variety': variety_score,
+                'penalty': penalty_score,
+                'total_score': total_score
+            }
 
-        # Calculate and all the component score + the final total score
-        length_score = self._get_length_score(essay)
-        relevance_score = self._get_relevance_score(prob_statement, essay)
-        rarity_score = self._get_rarity_score(essay)
-        variety_score = self._get_variety_score(essay)
-        penalty_score = self._get_filler_penalty(essay)
+        if self.stats is not None:
+            self.stats.finish_essay(file_path)
 
-        total_score = length_score + relevance_score + rarity_score + variety_score + penalty_score
+        return scores
 
-        return {
-            'length': length_score,
-            'relevance': relevance_score,
-            'rarity': rarity_score,
-            'variety': variety_score,
-            'penalty': penalty_score,
-            'total_score': total_score
-        }
+    def _timed(self, stage: str, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        This function calls func(*args), recording its wall time under stage when the scorer is instrumented.
+
+        Args:
+            1. stage (str): The stage name.
+            2. func (Callable[..., Any]): The stage function.
+            3. *args (Any): Its arguments.
+
+        Returns:
+            Any: The result of func.
+        """
+        if self.stats is None:
+            return func(*args)
+
+        start = perf_counter()
+        result = func(*args)
+        self.stats.record(stage, perf_counter() - start)
+
+        return result
+
+    def score_essays(
+            self,
+            prob_statement: str,
+            paths: Iterable[str],
+            workers: int = 1
+        ) -> Iterator[Tuple[str, Dict[str, float]]]:
+        """
+        This function scores a batch of essays, fanning them out across a process pool.
+        Each worker reuses this scorer (and its read-only TextProcessor vocabulary),
+        inherited through fork where available instead of being copied for every essay.
+
+        Args:
+            1. prob_statement (str): The given problem statement that contains the topic words for essay evaluation.
+            2. paths (Iterable[str]): The paths to where the essay text files are located.
+            3. workers (int): Number of processes scoring the essays (default: 1, score in the current process).
+
+        Returns:
+            Iterator[Tuple[str, Dict[str, float]]]: The path of each essay with its scores (same dictionary
+            as score_essay), yielded as soon as the essay is scored (in completion order with more than one worker).
+            The timings of the workers are aggregated into the stats of this scorer.
+        """
+        if workers <= 1:
+            for file_path in paths:
+                yield file_path, self.score_essay(prob_statement, file_path)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=self._get_pool_context(),
+            initializer=_init_worker,
+            initargs=(self,)
+        ) as executor:
+            futures = [
+                executor.submit(_score_essay_worker, prob_statement, file_path)
+                for file_path in paths
+            ]
+
+            for future in as_completed(futures):
+                file_path, scores, timings = future.result()
+
+                if self.stats is not None:
+                    self.stats.add_essay(file_path, timings)
+
+                yield file_path, scores
+
+    def score_essays_matrix(self, prob_statement: str, paths: Iterable[str]) -> List[Dict[str, float]]:
+        """
+        This function scores a batch of essays at once: the essays are counted into a sparse
+        document-term matrix, and every criterion is computed for the whole batch with NumPy
+        array operations over its entries (row sums over the stopword, topic word and rarity columns).
+
+        Args:
+            1. prob_statement (str): The given problem statement that contains the topic words for essay evaluation.
+            2. paths (Iterable[str]): The paths to where the essay text files are located.
+
+        Returns:
+            List[Dict[str, float]]: The scores of each essay (same dictionary as score_essay), in the order of paths.
+        """
+        paths = list(paths)
+
+        if not prob_statement:
+            print("Missing problem_statement parameter or it is empty!")
+            return [{} for _ in paths]
+
+        # Extract the essay texts and count their words
+        essays = []
+        for file_path in paths:
+            with open(file_path, "r") as f:
+                essays.append(f.read().strip())
+
+        matrix = DocumentTermMatrix(essays, self.text_processor.tokenizer)
+        counts = matrix.counts.astype(np.float64)
+
+        # Flag the columns (stopwords, topic words) and gather their rarity points
+        stopwords = self.text_processor.get_stopword_index()
+        topic_words = self.topic_cache.get_topic_words(prob_statement, self.text_processor)
+        rarity_points = self.rarity_index.points
+
+        is_content = ~matrix.get_column_mask(stopwords)[matrix.columns]
+        is_topic = matrix.get_column_mask(topic_words)[matrix.columns] & is_content
+        word_points = np.fromiter(
+            (rarity_points.get(word, UNKNOWN_WORD_POINTS) for word in matrix.words),
+            dtype=np.float64,
+            count=len(matrix.words)
+        )[matrix.columns]
+
+        # Per-essay counts
+        word_count = matrix.get_row_sums(counts)
+        content_word_count = matrix.get_row_sums(counts * is_content)
+        unique_words_count = matrix.get_row_sums(is_content.astype(np.float64))
+        stopword_count = word_count - content_word_count
+        found_topic_words = matrix.get_row_sums(np.minimum(counts, 3) * is_topic)
+        total_rarity_points = matrix.get_row_sums(word_points * is_content)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # 1/ Length: 10% deduction for every 20 words under / overshoot, cap at 0
+            word_diff = np.where(word_count < 300, 300 - word_count, word_count - 500)
+            length_score = np.where(
+                (word_count >= 300) & (word_count <= 500), 10.0, np.maximum(0.0, 10.0 - word_diff / 20)
+            )
+
+            # 2/ Relevance
+            max_topic_words = len(topic_words) * 3
+            relevance_score = np.where(
+                found_topic_words > 0, 40 * (found_topic_words / max(max_topic_words, 1)), 0.0
+            )
+
+            # 3/ Rarity
+            rarity_score = np.where(
+                total_rarity_points > 0,
+                np.minimum(30.0, 30 * (total_rarity_points / (unique_words_count * 3))),
+                0.0
+            )
+
+            # 4/ Variety
+            variety_score = np.where(
+                content_word_count > 0, 20 * np.sqrt(unique_words_count / content_word_count), 0.0
+            )
+
+            # 5/ Filler penalty
+            penalty_score = np.where(
+                (word_count > 0) & (stopword_count / word_count >= 0.5), -10.0, 0.0
+            )
+
+        # Round the components as score_essay does, then add up the total score
+        scores = []
+        for length, relevance, rarity, variety, penalty in zip(
+                length_score.tolist(), relevance_score.tolist(), rarity_score.tolist(),
+                variety_score.tolist(), penalty_score.tolist()
+            ):
+            relevance, rarity, variety = round(relevance, 2), round(rarity, 2), round(variety, 2)
+
+            scores.append({
+                'length': length,
+                'relevance': relevance,
+                'rarity': rarity,
+                'variety': variety,
+                'penalty': penalty,
+                'total_score': length + relevance + rarity + variety + penalty
+            })
+
+        return scores
+
+    def _get_pool_context(self) -> Optional[multiprocessing.context.BaseContext]:
+        """
+        This function gets the start method of the score_essays workers: fork when the platform
+        supports it, so the scorer is shared copy-on-write, otherwise the default one
+        (the scorer is then pickled once per worker).
+
+        Returns:
+            Optional[multiprocessing.context.BaseContext]: The fork context, or None for the default one.
+        """
+        if "fork" in multiprocessing.get_all_start_methods():
+            return multiprocessing.get_context("fork")
+
+        return None
 
     # ========== MAIN FUNCTIONS ========== 
-    def _get_length_score(self, essay: str) -> float:
+    def _get_length_score(self, features: EssayFeatures) -> float:
         """ Scoring Criteria 1 - Length Check
         
         This function get the essay's word count and evaluates the score for length check.
 
         Args:
-            1. essay (str): The essay text.
+            1. features (EssayFeatures): The word counts of the essay.
 
         Returns:
             length_score (float): The length score (between 0.0 and 10.0).
@@ -108,12 +783,8 @@ class EssayScorer:
             - Case 2: Shorter than 300 words / Longer than 500 words
                 --> 10% deduction for every 20 words under / overshoot, cap at 0
         """
-        if len(essay) == 0:
-            return 0.0
-        
         # Count total words appear in the essay
-        essay_word_freq = self.text_processor.extract_word_freq(essay, [])
-        word_count = sum(essay_word_freq.values())
+        word_count = features.word_count
         
         # Calculate the score and penalties if word count is under / overshoot 
         if word_count >= 300 and word_count <= 500:
@@ -125,7 +796,7 @@ class EssayScorer:
 
         return length_score
     
-    def _get_relevance_score(self, prob_statement: str, essay: str) -> float:
+    def _get_relevance_score(self, prob_statement: str, features: EssayFeatures) -> float:
         """ Scoring Criteria 2 - Relevance Check
         
         This function get the topic words (excluding stopwords) of problem statement,
@@ -133,7 +804,7 @@ class EssayScorer:
 
         Args:
             1. prob_statement (str): The given problem statement that contains the topic words for essay evaluation.
-            2. essay (str): The essay text.
+            2. features (EssayFeatures): The word counts of the essay.
 
         Returns:
             relevance_score (float): Relevance score between 0.0 and 40.0.
@@ -148,17 +819,12 @@ class EssayScorer:
             - Case 3: no topic words appear
                 --> 0 mark
         """
-        if len(essay) == 0:
-            return 0.0
-
-        # Get the topic words list from the problem statement
-        stopwords = self.text_processor.get_stopwords()
-        statement_word_freq = self.text_processor.extract_word_freq(prob_statement, stopwords)
-        topic_words = statement_word_freq.keys()
+        # Get the (cached) topic words of the problem statement
+        topic_words = self.topic_cache.get_topic_words(prob_statement, self.text_processor)
         
         # Get all the topic words and count their appearance in the essay text
-        essay_word_freq = self.text_processor.extract_word_freq(essay, self.text_processor.get_stopwords())
-        count_dict = {word: freq for word, freq in essay_word_freq.items() if word in topic_words}
+        essay_word_freq = features.content_word_freq
+        count_dict = {word: essay_word_freq[word] for word in topic_words if word in essay_word_freq}
         
         if not count_dict:
             return 0.0 
@@ -171,14 +837,14 @@ class EssayScorer:
 
         return relevance_score
 
-    def _get_rarity_score(self, essay: str) -> float:
+    def _get_rarity_score(self, features: EssayFeatures) -> float:
         """ Scoring Criteria 3 - Rarity Check
         
         This function count the number of unique words (excluding stopwords) in the essay,
         measure with the corpus words_freq dictionary, and calculate the rarity score.
 
         Args:
-            1. essay (str): The essay text.
+            1. features (EssayFeatures): The word counts of the essay.
 
         Returns:
             rarity_score (float): Rarity score between 0.0 and 30.0.
@@ -193,35 +859,11 @@ class EssayScorer:
             - 51-100: 2 marks
             - > 100: 1 mark
         """
-        if len(essay) == 0:
-            return 0.0
-        
-        # Get the unique words list from the essay and the word list from the TextProcessor corpus
-        essay_word_freq = self.text_processor.extract_word_freq(essay, self.text_processor.get_stopwords())
-        unique_words = essay_word_freq.keys()
-
-        corpus_word_freq = self.text_processor.get_word_freq()
-        corpus_words = corpus_word_freq.keys()
-
-        # Calculate the rarity point with corresponding mapping with the frequency-points table
-        total_rarity_points = 0
-        for word in unique_words:
-            if word not in corpus_words:
-                total_rarity_points -= 1
-                continue
-            
-            freq = self.text_processor.word_freq.get(word)
-            
-            if freq >= 1 and freq <= 3:
-                total_rarity_points += 5
-            elif freq >= 4 and freq <= 20:
-                total_rarity_points += 4
-            elif freq >= 21 and freq <= 50:
-                total_rarity_points += 3
-            elif freq >= 51 and freq <= 100:
-                total_rarity_points += 2
-            elif freq > 100:
-                total_rarity_points += 1
+        # Get the unique words list from the essay
+        unique_words = features.content_word_freq.keys()
+
+        # Sum the precomputed rarity points of the words (from the frequency-points table)
+        total_rarity_points = self.rarity_index.get_total_points(unique_words)
 
         if total_rarity_points <= 0:
             return 0.0
@@ -231,14 +873,14 @@ class EssayScorer:
 
         return rarity_points
 
-    def _get_variety_score(self, essay: str) -> float:
+    def _get_variety_score(self, features: EssayFeatures) -> float:
         """ Scoring Criteria 4 - Variety Check
         
         This function count the number of unique words (excluding stopwords) and also total words in the essay,
         to calculate the variety score.
 
         Args:
-            1. essay (str): The essay text.
+            1. features (EssayFeatures): The word counts of the essay.
 
         Returns:
             variety_score (float): Variety score between 0.0 and 20.0. 
@@ -248,27 +890,26 @@ class EssayScorer:
             Let U = number of unique non-stopwords, L = total non-stopwords appear
             --> variety_score = 20 * math.sqrt(U / L)
         """
-        if len(essay) == 0:
-            return 0.0
-        
         # Get the word_count for unique words and all words appear (excluding stopwords)
-        essay_word_freq = self.text_processor.extract_word_freq(essay, self.text_processor.get_stopwords())
-        unique_words_count = len(essay_word_freq.keys())
-        total_words_count = sum(essay_word_freq.values())
+        unique_words_count = len(features.content_word_freq)
+        total_words_count = features.content_word_count
+
+        if total_words_count == 0:
+            return 0.0
         
         # Compute variety score by the formula
         variety_score = round(20 * math.sqrt((unique_words_count / total_words_count)), 2)
 
         return variety_score
     
-    def _get_filler_penalty(self, essay: str) -> float:
+    def _get_filler_penalty(self, features: EssayFeatures) -> float:
         """ Scoring Criteria 5 - Filler Penalty
         
         This function count the number of stopwords in the essay, and
         calculate the penalty (if occured) based on the percentage of stopword appearance.
 
         Args:
-            1. essay: (str) The essay text.
+            1. features (EssayFeatures): The word counts of the essay.
 
         Returns:
             float: The filler penality: 0.0 or 10.0. 
@@ -276,18 +917,14 @@ class EssayScorer:
         Requirements: 
             Subtract 10 marks if 50% of essay are stopwords
         """
-        if len(essay) == 0:
-            return 0.0
-        
         # Count the number of stopwords and total word_count of the essay
-        essay_word_freq = self.text_processor.extract_word_freq(essay, [])
-        stopwords = self.text_processor.get_stopwords()
-        essay_stopwords_freq = {word: freq for word, freq in essay_word_freq.items() if word in stopwords}
+        essay_stopwords_count = features.stopword_count
+        total_word_count = features.word_count
         
         # Calculate the percentage of stopwords appearance and compute the penalty if appear over 50%
-        essay_stopwords_count = sum(essay_stopwords_freq.values())
-        total_word_count = sum(essay_word_freq.values())
-        
+        if total_word_count == 0:
+            return 0.0
+
         if essay_stopwords_count / total_word_count >= 0.5:
             return -10.0
 
@@ -298,6 +935,7 @@ if __name__ == "__main__":
         stopwords_filepath="data/stop_words_english.txt",
         corpus_filepath="data/ag_news_test.csv",
         idx2label_filepath="data/idx2label.json",
+        persist="never",
     )
     scorer = EssayScorer(tp)
     prob_statement = "The impact of technology on education."